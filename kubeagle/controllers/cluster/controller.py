@@ -14,6 +14,7 @@ import math
 import os
 import subprocess
 import time
+import weakref
 from collections import OrderedDict
 from collections.abc import Callable
 from contextlib import suppress
@@ -30,6 +31,7 @@ from kubeagle.constants.timeouts import (
 from kubeagle.controllers.base import BaseController
 from kubeagle.controllers.cluster.fetchers import (
     ClusterFetcher,
+    DecodedItemsCache,
     EventFetcher,
     NodeFetcher,
     PodFetcher,
@@ -114,6 +116,7 @@ class ClusterController(BaseController):
     _GLOBAL_COMMAND_CACHE_MAX_ENTRIES = (
         256  # Generous limit — avoids evicting useful entries
     )
+    _decoded_items_caches: weakref.WeakSet[DecodedItemsCache] = weakref.WeakSet()
 
     @classmethod
     def get_semaphore(cls, max_concurrent: int | None = None) -> asyncio.Semaphore:
@@ -177,6 +180,8 @@ class ClusterController(BaseController):
             context: Optional context name. When provided, only cache entries
                 for that context are cleared.
         """
+        for items_cache in list(cls._decoded_items_caches):
+            items_cache.clear()
         if context is None:
             cls._global_kubectl_cache.clear()
             cls._global_helm_cache.clear()
@@ -279,13 +284,25 @@ class ClusterController(BaseController):
             asyncio.Task[tuple[Any, Any, Any, Any]] | None
         ) = None
 
-        # Initialize fetchers
-        self._node_fetcher = NodeFetcher(self._run_kubectl_cached)
-        self._pod_fetcher = PodFetcher(self._run_kubectl_cached)
-        self._event_fetcher = EventFetcher(self._run_kubectl_cached)
+        # Initialize fetchers. Decoded kubectl items are shared across fetchers
+        # so a command output served from the global cache is parsed only once.
+        self._decoded_items_cache = DecodedItemsCache(
+            ttl_seconds=self._GLOBAL_COMMAND_CACHE_TTL_SECONDS
+        )
+        self._decoded_items_caches.add(self._decoded_items_cache)
+        self._node_fetcher = NodeFetcher(
+            self._run_kubectl_cached, items_cache=self._decoded_items_cache
+        )
+        self._pod_fetcher = PodFetcher(
+            self._run_kubectl_cached, items_cache=self._decoded_items_cache
+        )
+        self._event_fetcher = EventFetcher(
+            self._run_kubectl_cached, items_cache=self._decoded_items_cache
+        )
         self._cluster_fetcher = ClusterFetcher(
             self._run_kubectl_cached,
             self._run_helm_cached,
+            items_cache=self._decoded_items_cache,
         )
         self._top_metrics_fetcher = TopMetricsFetcher(self._run_kubectl_cached)
 
@@ -1680,6 +1697,15 @@ class ClusterController(BaseController):
             self._helm_releases_cache = list(releases)
             return releases
 
+        if on_namespace_loaded is None:
+            # Nothing is streamed, so one cluster-wide `helm list -A` replaces a
+            # helm fork per namespace. An empty result may mean the cluster-wide
+            # list was denied, so fall back to the per-namespace calls below.
+            releases = await self._cluster_fetcher.fetch_helm_releases()
+            if releases:
+                self._helm_releases_cache = list(releases)
+                return releases
+
         semaphore = asyncio.Semaphore(self._progressive_parallelism)
         total = len(namespaces)
         completed = 0
@@ -2090,8 +2116,9 @@ class ClusterController(BaseController):
     ) -> dict[str, dict[str, float]]:
         """Return node name -> real CPU/memory usage from `kubectl top node`."""
         lookup: dict[str, dict[str, float]] = {}
+        # Rows come from TopMetricsFetcher, whose names are already stripped.
         for row in rows:
-            name = str(row.get("node_name", "") or "").strip()
+            name = row.get("node_name")
             if not name:
                 continue
             lookup[name] = {
@@ -2106,9 +2133,10 @@ class ClusterController(BaseController):
     ) -> dict[tuple[str, str], dict[str, float]]:
         """Return (namespace, pod_name) -> real CPU/memory usage from `kubectl top pod`."""
         lookup: dict[tuple[str, str], dict[str, float]] = {}
+        # Rows come from TopMetricsFetcher, whose names are already stripped.
         for row in rows:
-            namespace = str(row.get("namespace", "") or "").strip()
-            pod_name = str(row.get("pod_name", "") or "").strip()
+            namespace = row.get("namespace")
+            pod_name = row.get("pod_name")
             if not namespace or not pod_name:
                 continue
             lookup[(namespace, pod_name)] = {
@@ -2272,7 +2300,7 @@ class ClusterController(BaseController):
             effective_nodes = (
                 nodes_items
                 if nodes_items is not None
-                else await self._node_fetcher.fetch_nodes_raw(
+                else await self._node_fetcher.fetch_node_items(
                     request_timeout=self._NODE_POD_ENRICH_REQUEST_TIMEOUT
                 )
             )
@@ -2741,7 +2769,7 @@ class ClusterController(BaseController):
         """Fetch pod/node/top metrics concurrently for workload runtime enrichment."""
         results = await asyncio.gather(
             self._pod_fetcher.fetch_pods(request_timeout=CLUSTER_REQUEST_TIMEOUT),
-            self._node_fetcher.fetch_nodes_raw(request_timeout=CLUSTER_REQUEST_TIMEOUT),
+            self._node_fetcher.fetch_node_items(request_timeout=CLUSTER_REQUEST_TIMEOUT),
             self._top_metrics_fetcher.fetch_top_nodes(
                 request_timeout=self._TOP_METRICS_REQUEST_TIMEOUT
             ),
@@ -3149,6 +3177,13 @@ class ClusterController(BaseController):
             await asyncio.wait_for(
                 semaphore.acquire(), timeout=self._SEMAPHORE_ACQUIRE_TIMEOUT
             )
+            # `kubectl top node` is independent of the node/pod fetches below;
+            # start it now so its latency overlaps with theirs.
+            top_nodes_task = asyncio.create_task(
+                self._top_metrics_fetcher.fetch_top_nodes(
+                    request_timeout=self._TOP_METRICS_REQUEST_TIMEOUT,
+                )
+            )
 
             try:
                 self._notify_progress(progress_callback, self.SOURCE_NODES, 0, 1)
@@ -3221,9 +3256,7 @@ class ClusterController(BaseController):
                         )
                 # Enrich with real CPU/memory usage from kubectl top node
                 try:
-                    top_node_rows = await self._top_metrics_fetcher.fetch_top_nodes(
-                        request_timeout=self._TOP_METRICS_REQUEST_TIMEOUT,
-                    )
+                    top_node_rows = await top_nodes_task
                     if top_node_rows:
                         top_usage = self._build_top_node_usage_lookup(top_node_rows)
                         for node in nodes:
@@ -3248,7 +3281,10 @@ class ClusterController(BaseController):
                 self._notify_progress(progress_callback, self.SOURCE_NODES, 1, 1)
                 return nodes
             finally:
+                if not top_nodes_task.done():
+                    top_nodes_task.cancel()
                 semaphore.release()
+                await asyncio.gather(top_nodes_task, return_exceptions=True)
         except asyncio.CancelledError:
             self._update_fetch_state(
                 self.SOURCE_NODES, FetchState.ERROR, "Fetch cancelled"
@@ -3282,12 +3318,12 @@ class ClusterController(BaseController):
                 # Fetch nodes and pods in parallel when cache is cold
                 if self._pods_cache:
                     nodes_items, pods_data = (
-                        await self._node_fetcher.fetch_nodes_raw(),
+                        await self._node_fetcher.fetch_node_items(),
                         self._pods_cache,
                     )
                 else:
                     nodes_items, pods_data = await asyncio.gather(
-                        self._node_fetcher.fetch_nodes_raw(),
+                        self._node_fetcher.fetch_node_items(),
                         self._pod_fetcher.fetch_pods(),
                     )
                 try:
@@ -3452,7 +3488,7 @@ class ClusterController(BaseController):
                     progress_callback, self.SOURCE_POD_DISTRIBUTION, 0, 1
                 )
 
-                nodes_items = await self._node_fetcher.fetch_nodes_raw()
+                nodes_items = await self._node_fetcher.fetch_node_items()
                 if self._pods_cache:
                     pods = list(self._pods_cache)
                     if on_namespace_update is not None:
@@ -3,6 +3,9 @@
 from kubeagle.controllers.cluster.fetchers.cluster_fetcher import (
     ClusterFetcher,
 )
+from kubeagle.controllers.cluster.fetchers.decode_cache import (
+    DecodedItemsCache,
+)
 from kubeagle.controllers.cluster.fetchers.event_fetcher import (
     EventFetcher,
 )
@@ -14,6 +17,7 @@ from kubeagle.controllers.cluster.fetchers.top_metrics_fetcher import (
 
 __all__ = [
     "ClusterFetcher",
+    "DecodedItemsCache",
     "EventFetcher",
     "NodeFetcher",
     "PodFetcher",
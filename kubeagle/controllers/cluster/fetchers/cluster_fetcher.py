@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
+from kubeagle.controllers.cluster.fetchers.decode_cache import DecodedItemsCache
 from kubeagle.models.charts.chart_info import HelmReleaseInfo
 
 logger = logging.getLogger(__name__)
@@ -16,16 +18,23 @@ class ClusterFetcher:
     """Fetches cluster-level data from Kubernetes cluster."""
 
     def __init__(
-        self, run_kubectl_func: Any, run_helm_func: Any | None = None
+        self,
+        run_kubectl_func: Any,
+        run_helm_func: Any | None = None,
+        items_cache: DecodedItemsCache | None = None,
     ) -> None:
         """Initialize with kubectl and helm runner functions.
 
         Args:
             run_kubectl_func: Async function to run kubectl commands
             run_helm_func: Optional async function to run helm commands
+            items_cache: Optional decoded-items cache shared with other fetchers
         """
         self._run_kubectl = run_kubectl_func
         self._run_helm = run_helm_func
+        self._items_cache = (
+            items_cache if items_cache is not None else DecodedItemsCache()
+        )
 
     async def check_cluster_connection(self) -> bool:
         """Check if cluster connection is working.
@@ -46,12 +55,27 @@ class ClusterFetcher:
         if not output.strip():
             return False
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
+            data = orjson.loads(output)
+        except orjson.JSONDecodeError:
             # Command succeeded but output wasn't JSON; treat as connected.
             return True
         return bool(data.get("serverVersion"))
 
+    @staticmethod
+    def _build_release(
+        release: dict[str, Any],
+        namespace_default: str = "",
+    ) -> HelmReleaseInfo:
+        """Build HelmReleaseInfo from a `helm list -o json` entry."""
+        return HelmReleaseInfo(
+            name=release.get("name", ""),
+            namespace=release.get("namespace", namespace_default),
+            chart=release.get("chart", ""),
+            version=release.get("version", ""),
+            app_version=release.get("app_version", ""),
+            status=release.get("status", ""),
+        )
+
     async def fetch_helm_releases(self) -> list[HelmReleaseInfo]:
         """Fetch Helm releases from the cluster.
 
@@ -62,24 +86,15 @@ class ClusterFetcher:
             return []
 
         try:
-            result = await self._run_helm(("list", "-A", "-o", "json"))
+            # helm caps list output at 256 releases unless --max 0 is given.
+            result = await self._run_helm(("list", "-A", "--max", "0", "-o", "json"))
             if not result:
                 return []
 
-            releases_data = json.loads(result)
-            return [
-                HelmReleaseInfo(
-                    name=r.get("name", ""),
-                    namespace=r.get("namespace", ""),
-                    chart=r.get("chart", ""),
-                    version=r.get("version", ""),
-                    app_version=r.get("app_version", ""),
-                    status=r.get("status", ""),
-                )
-                for r in releases_data
-            ]
+            releases_data = orjson.loads(result)
+            return [self._build_release(r) for r in releases_data]
 
-        except (json.JSONDecodeError, Exception):
+        except (orjson.JSONDecodeError, Exception):
             logger.exception("Error fetching Helm releases")
             return []
 
@@ -98,20 +113,10 @@ class ClusterFetcher:
             if not result:
                 return []
 
-            releases_data = json.loads(result)
-            return [
-                HelmReleaseInfo(
-                    name=r.get("name", ""),
-                    namespace=r.get("namespace", namespace),
-                    chart=r.get("chart", ""),
-                    version=r.get("version", ""),
-                    app_version=r.get("app_version", ""),
-                    status=r.get("status", ""),
-                )
-                for r in releases_data
-            ]
+            releases_data = orjson.loads(result)
+            return [self._build_release(r, namespace) for r in releases_data]
 
-        except (json.JSONDecodeError, Exception):
+        except (orjson.JSONDecodeError, Exception):
             logger.exception(
                 "Error fetching Helm releases for namespace %s",
                 namespace,
@@ -124,45 +129,39 @@ class ClusterFetcher:
         Returns:
             List of PDB dictionaries.
         """
-        output = await self._run_kubectl(
-            ("get", "pdb", "-A", "-o", "json", f"--request-timeout={CLUSTER_REQUEST_TIMEOUT}")
-        )
+        args = ("get", "pdb", "-A", "-o", "json", f"--request-timeout={CLUSTER_REQUEST_TIMEOUT}")
+        output = await self._run_kubectl(args)
 
         if not output:
             return []
 
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
+            return self._items_cache.decode_items(args, output)
+        except orjson.JSONDecodeError:
             logger.exception("Error parsing PDBs JSON")
             return []
 
-        return data.get("items", [])
-
     async def fetch_pdbs_for_namespace(self, namespace: str) -> list[dict[str, Any]]:
         """Fetch PodDisruptionBudgets from a single namespace."""
         if not namespace:
             return []
 
-        output = await self._run_kubectl(
-            (
-                "get",
-                "pdb",
-                "-n",
-                namespace,
-                "-o",
-                "json",
-                f"--request-timeout={CLUSTER_REQUEST_TIMEOUT}",
-            )
+        args = (
+            "get",
+            "pdb",
+            "-n",
+            namespace,
+            "-o",
+            "json",
+            f"--request-timeout={CLUSTER_REQUEST_TIMEOUT}",
         )
+        output = await self._run_kubectl(args)
 
         if not output:
             return []
 
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
+            return self._items_cache.decode_items(args, output)
+        except orjson.JSONDecodeError:
             logger.exception("Error parsing PDBs JSON for namespace %s", namespace)
             return []
-
-        return data.get("items", [])
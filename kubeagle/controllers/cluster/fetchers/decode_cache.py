@@ -0,0 +1,84 @@
+"""Decoded kubectl output cache shared by cluster fetchers."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+
+class DecodedItemsCache:
+    """Memoizes decoded ``items`` lists per kubectl command.
+
+    The controller's command runner already deduplicates in-flight calls and
+    serves repeated commands from a TTL cache, returning the same output string
+    object. When a fetcher sees that identical object again, the previously
+    decoded items are reused instead of parsing multi-MB JSON a second time.
+    Entries expire after ``ttl_seconds`` (the command cache TTL) and only a
+    handful are kept, so cluster-sized payloads are not retained after the
+    command cache has dropped them.
+    """
+
+    _MAX_ENTRIES = 8
+    _TTL_SECONDS = 120.0
+
+    def __init__(
+        self,
+        max_entries: int = _MAX_ENTRIES,
+        ttl_seconds: float = _TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of commands kept (least recently used first out).
+            ttl_seconds: Seconds a decoded entry stays valid after being stored.
+        """
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[
+            tuple[str, ...], tuple[float, str, list[dict[str, Any]]]
+        ] = OrderedDict()
+
+    def decode_items(
+        self,
+        args: tuple[str, ...],
+        output: str,
+    ) -> list[dict[str, Any]]:
+        """Return the ``items`` list decoded from kubectl JSON output.
+
+        Raises:
+            orjson.JSONDecodeError: If output is not valid JSON.
+        """
+        now = time.monotonic()
+        cached = self._entries.get(args)
+        if (
+            cached is not None
+            and cached[1] is output
+            and now - cached[0] <= self._ttl_seconds
+        ):
+            self._entries.move_to_end(args)
+            return list(cached[2])
+
+        self._prune_expired(now)
+        items = orjson.loads(output).get("items", [])
+        self._entries[args] = (now, output, items)
+        self._entries.move_to_end(args)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return list(items)
+
+    def _prune_expired(self, now: float) -> None:
+        """Drop entries older than the TTL."""
+        expired = [
+            key
+            for key, (stored_at, _, _) in self._entries.items()
+            if now - stored_at > self._ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all decoded entries."""
+        self._entries.clear()
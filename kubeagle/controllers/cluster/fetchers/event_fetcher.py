@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import math
-from contextlib import suppress
-from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import orjson
+
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
+from kubeagle.controllers.cluster.fetchers.decode_cache import DecodedItemsCache
+from kubeagle.controllers.cluster.fetchers.timeout_errors import is_timeout_error
 
 logger = logging.getLogger(__name__)
 
@@ -21,96 +21,27 @@ class EventFetcher:
     _EVENT_QUERY_TIMEOUT = CLUSTER_REQUEST_TIMEOUT
     _RETRY_EVENT_QUERY_TIMEOUT = "45s"
     _EVENT_CHUNK_SIZE = 200
-    _TIMEOUT_ERROR_TOKENS = (
-        "timed out",
-        "timeout",
-        "deadline exceeded",
-        "i/o timeout",
-        "context deadline exceeded",
-    )
-
-    def __init__(self, run_kubectl_func: Any) -> None:
+
+    def __init__(
+        self,
+        run_kubectl_func: Any,
+        items_cache: DecodedItemsCache | None = None,
+    ) -> None:
         """Initialize with kubectl runner function.
 
         Args:
             run_kubectl_func: Async function to run kubectl commands
+            items_cache: Optional decoded-items cache shared with other fetchers
         """
         self._run_kubectl = run_kubectl_func
-
-    @staticmethod
-    def _parse_iso_timestamp(timestamp: Any) -> datetime | None:
-        """Parse kubernetes timestamp strings into aware datetimes."""
-        if not isinstance(timestamp, str) or not timestamp:
-            return None
-        with suppress(ValueError, TypeError):
-            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return None
-
-    @staticmethod
-    def _parse_event_count(event: dict[str, Any]) -> int:
-        """Parse event count across core/events.k8s.io shapes."""
-        raw_value = (
-            event.get("count")
-            or event.get("deprecatedCount")
-            or event.get("series", {}).get("count")
-            or 1
+        self._items_cache = (
+            items_cache if items_cache is not None else DecodedItemsCache()
         )
-        with suppress(ValueError, TypeError):
-            return max(1, int(raw_value))
-        return 1
-
-    @classmethod
-    def _event_count_in_window(
-        cls,
-        event: dict[str, Any],
-        *,
-        now: datetime,
-        max_age_seconds: float,
-        event_datetime: datetime | None = None,
-    ) -> int:
-        """Estimate how many repeated occurrences happened within the lookback window."""
-        total_count = cls._parse_event_count(event)
-        if total_count <= 1:
-            return total_count
-
-        last_seen = event_datetime or cls._parse_iso_timestamp(
-            event.get("series", {}).get("lastObservedTime")
-            or event.get("lastTimestamp")
-            or event.get("deprecatedLastTimestamp")
-            or event.get("eventTime")
-            or event.get("metadata", {}).get("creationTimestamp")
-        )
-        if last_seen is None:
-            return total_count
-
-        cutoff = now - timedelta(seconds=max_age_seconds)
-        if last_seen < cutoff:
-            return 0
-
-        first_seen = cls._parse_iso_timestamp(
-            event.get("firstTimestamp")
-            or event.get("deprecatedFirstTimestamp")
-            or event.get("eventTime")
-            or event.get("metadata", {}).get("creationTimestamp")
-        )
-        if first_seen is None or last_seen <= first_seen:
-            return total_count
-        if first_seen >= cutoff:
-            return total_count
-
-        span_seconds = (last_seen - first_seen).total_seconds()
-        if span_seconds <= 0:
-            return total_count
-
-        overlap_seconds = (last_seen - cutoff).total_seconds()
-        scaled_count = math.ceil(total_count * (overlap_seconds / span_seconds))
-        return max(1, min(total_count, scaled_count))
 
     @classmethod
     def _is_timeout_error(cls, error: Exception) -> bool:
         """Return True when error indicates timeout-like failure."""
-        message = str(error).lower()
-        return any(token in message for token in cls._TIMEOUT_ERROR_TOKENS)
+        return is_timeout_error(error)
 
     def _build_warning_events_args(self, request_timeout: str) -> tuple[str, ...]:
         """Build warning-only event query arguments."""
@@ -126,24 +57,17 @@ class EventFetcher:
         namespace: str | None = None,
     ) -> tuple[str, ...]:
         """Build warning-only event query arguments for all namespaces or one namespace."""
-        args: list[str] = [
+        scope = ("-n", namespace) if namespace else ("--all-namespaces",)
+        return (
             "get",
             "events",
-        ]
-        if namespace:
-            args.extend(["-n", namespace])
-        else:
-            args.append("--all-namespaces")
-        args.extend(
-            [
-                "--field-selector=type=Warning",
-                f"--chunk-size={self._EVENT_CHUNK_SIZE}",
-                "-o",
-                "json",
-                f"--request-timeout={request_timeout}",
-            ]
+            *scope,
+            "--field-selector=type=Warning",
+            f"--chunk-size={self._EVENT_CHUNK_SIZE}",
+            "-o",
+            "json",
+            f"--request-timeout={request_timeout}",
         )
-        return tuple(args)
 
     async def fetch_warning_events_raw(
         self,
@@ -162,14 +86,14 @@ class EventFetcher:
                 timeout_plan.append(timeout)
 
         output = ""
+        args: tuple[str, ...] = ()
         for attempt, timeout in enumerate(timeout_plan, start=1):
+            args = self._build_warning_events_args_for_scope(
+                request_timeout=timeout,
+                namespace=namespace,
+            )
             try:
-                output = await self._run_kubectl(
-                    self._build_warning_events_args_for_scope(
-                        request_timeout=timeout,
-                        namespace=namespace,
-                    )
-                )
+                output = await self._run_kubectl(args)
                 break
             except Exception as exc:
                 is_retryable = self._is_timeout_error(exc)
@@ -189,10 +113,8 @@ class EventFetcher:
             return []
 
         try:
-            data = json.loads(output)
-        except json.JSONDecodeError:
+            return self._items_cache.decode_items(args, output)
+        except orjson.JSONDecodeError:
             logger.exception("Error parsing events JSON")
             return []
 
-        return data.get("items", [])
-
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from collections.abc import Callable, Iterator
 from typing import Any
 
+import orjson
+
 from kubeagle.constants.enums import NodeStatus
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
+from kubeagle.controllers.cluster.fetchers.decode_cache import DecodedItemsCache
+from kubeagle.controllers.cluster.fetchers.timeout_errors import is_timeout_error
 from kubeagle.models.core.node_info import NodeInfo
 from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
 
@@ -29,6 +33,22 @@ _AZ_LABELS = (
     "topology.kubernetes.io/zone",
     "failure-domain.beta.kubernetes.io/zone",
 )
+# Server-side projection of the node fields consumed by node parsers. Full node
+# objects carry large status.images/volumesAttached payloads that are never read.
+_NODE_SUMMARY_FIELDS = (
+    ".metadata.name",
+    ".metadata.labels",
+    ".status.allocatable",
+    ".status.conditions",
+    ".status.nodeInfo.kubeletVersion",
+    ".spec.taints",
+    ".spec.unschedulable",
+)
+_NODE_SUMMARY_JSONPATH = (
+    "jsonpath={range .items[*]}"
+    + '{"\\t"}'.join(f"{{{field}}}" for field in _NODE_SUMMARY_FIELDS)
+    + '{"\\n"}{end}'
+)
 
 
 def _get_label_value(
@@ -47,27 +67,27 @@ class NodeFetcher:
 
     _NODES_CHUNK_SIZE = 200
     _RETRY_REQUEST_TIMEOUT = "45s"
-    _TIMEOUT_ERROR_TOKENS = (
-        "timed out",
-        "timeout",
-        "deadline exceeded",
-        "i/o timeout",
-        "context deadline exceeded",
-    )
-
-    def __init__(self, run_kubectl_func: Any) -> None:
+
+    def __init__(
+        self,
+        run_kubectl_func: Any,
+        items_cache: DecodedItemsCache | None = None,
+    ) -> None:
         """Initialize with kubectl runner function.
 
         Args:
             run_kubectl_func: Async function to run kubectl commands
+            items_cache: Optional decoded-items cache shared with other fetchers
         """
         self._run_kubectl = run_kubectl_func
+        self._items_cache = (
+            items_cache if items_cache is not None else DecodedItemsCache()
+        )
 
     @classmethod
     def _is_timeout_error(cls, error: Exception) -> bool:
         """Return True when error indicates timeout-like failure."""
-        message = str(error).lower()
-        return any(token in message for token in cls._TIMEOUT_ERROR_TOKENS)
+        return is_timeout_error(error)
 
     def _build_nodes_args(self, request_timeout: str) -> tuple[str, ...]:
         """Build kubectl args for fetching nodes."""
@@ -80,11 +100,59 @@ class NodeFetcher:
             f"--request-timeout={request_timeout}",
         )
 
-    async def fetch_nodes_raw(
-        self,
-        request_timeout: str | None = None,
-    ) -> list[dict[str, Any]]:
-        """Fetch raw node dictionaries with timeout-aware retries."""
+    def _build_nodes_summary_args(self, request_timeout: str) -> tuple[str, ...]:
+        """Build kubectl args for the projected node summary query."""
+        return (
+            "get",
+            "nodes",
+            "-o",
+            _NODE_SUMMARY_JSONPATH,
+            f"--chunk-size={self._NODES_CHUNK_SIZE}",
+            f"--request-timeout={request_timeout}",
+        )
+
+    @staticmethod
+    def _iter_nodes_summary(output: str) -> Iterator[dict[str, Any]]:
+        """Yield node item dicts rebuilt from projected summary lines.
+
+        Items keep the kubectl node layout but only carry the projected fields;
+        empty fields are omitted so parsers apply the same defaults as for full
+        node objects.
+
+        Raises:
+            ValueError: If a line does not match the projection shape.
+        """
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            fields = line.split("\t")
+            if len(fields) != len(_NODE_SUMMARY_FIELDS):
+                raise ValueError("Unexpected node summary line shape")
+            (
+                name,
+                labels,
+                allocatable,
+                conditions,
+                kubelet_version,
+                taints,
+                unschedulable,
+            ) = fields
+            metadata: dict[str, Any] = {"labels": orjson.loads(labels) if labels else {}}
+            if name:
+                metadata["name"] = name
+            status: dict[str, Any] = {
+                "allocatable": orjson.loads(allocatable) if allocatable else {},
+                "conditions": orjson.loads(conditions) if conditions else [],
+            }
+            if kubelet_version:
+                status["nodeInfo"] = {"kubeletVersion": kubelet_version}
+            spec: dict[str, Any] = {"taints": orjson.loads(taints) if taints else []}
+            if unschedulable:
+                spec["unschedulable"] = unschedulable == "true"
+            yield {"metadata": metadata, "status": status, "spec": spec}
+
+    def _attempt_timeouts(self, request_timeout: str | None) -> list[str]:
+        """Return the ordered, de-duplicated request timeouts to try."""
         timeout_arg = request_timeout or CLUSTER_REQUEST_TIMEOUT
         candidate_timeouts = (
             timeout_arg,
@@ -95,19 +163,24 @@ class NodeFetcher:
         for timeout in candidate_timeouts:
             if timeout not in attempt_timeouts:
                 attempt_timeouts.append(timeout)
+        return attempt_timeouts
+
+    async def _run_nodes_query(
+        self,
+        build_args: Callable[[str], tuple[str, ...]],
+        request_timeout: str | None,
+    ) -> tuple[tuple[str, ...], str]:
+        """Run a node query, retrying timeout failures with longer timeouts.
 
+        Returns:
+            The args of the successful attempt and its output.
+        """
+        attempt_timeouts = self._attempt_timeouts(request_timeout)
         last_error: Exception | None = None
         for attempt, timeout in enumerate(attempt_timeouts, start=1):
-            args = self._build_nodes_args(timeout)
+            args = build_args(timeout)
             try:
-                output = await self._run_kubectl(args)
-                if not output:
-                    return []
-                data = json.loads(output)
-                return data.get("items", [])
-            except json.JSONDecodeError:
-                logger.exception("Error parsing nodes JSON")
-                return []
+                return args, await self._run_kubectl(args)
             except Exception as exc:
                 last_error = exc
                 is_retryable = self._is_timeout_error(exc)
@@ -124,7 +197,121 @@ class NodeFetcher:
 
         if last_error is not None:
             raise last_error
-        return []
+        return (), ""
+
+    async def fetch_nodes_raw(
+        self,
+        request_timeout: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch raw node dictionaries with timeout-aware retries."""
+        args, output = await self._run_nodes_query(
+            self._build_nodes_args, request_timeout
+        )
+        if not output:
+            return []
+        try:
+            return self._items_cache.decode_items(args, output)
+        except orjson.JSONDecodeError:
+            logger.exception("Error parsing nodes JSON")
+            return []
+
+    async def fetch_node_items(
+        self,
+        request_timeout: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch node dictionaries trimmed to the fields node parsers read.
+
+        Uses the server-side summary projection with the same timeout retries
+        as ``fetch_nodes_raw``. Only when the projection output cannot be
+        decoded (older kubectl releases print maps in Go syntax) is the full
+        node list fetched instead.
+        """
+        _, output = await self._run_nodes_query(
+            self._build_nodes_summary_args, request_timeout
+        )
+        try:
+            return list(self._iter_nodes_summary(output or ""))
+        except ValueError:
+            # JSON decode errors are ValueErrors as well.
+            logger.debug("Node summary projection unavailable, using full node list")
+        return await self.fetch_nodes_raw(request_timeout)
+
+    @classmethod
+    def _node_info_from_item(cls, item: dict[str, Any]) -> NodeInfo:
+        """Build a NodeInfo from a full node item dict."""
+        metadata = item.get("metadata", {})
+        status = item.get("status", {})
+        return cls._build_node_info(
+            metadata.get("name", "Unknown"),
+            metadata.get("labels", {}),
+            status.get("allocatable", {}),
+            status.get("conditions", []),
+            status.get("nodeInfo", {}).get("kubeletVersion", ""),
+            item.get("spec", {}).get("taints", []),
+        )
+
+    @staticmethod
+    def _build_node_info(
+        name: str,
+        labels: dict[str, str],
+        allocatable: dict[str, Any],
+        conditions: list[dict[str, Any]],
+        kubelet_version: str,
+        taints: list[dict[str, Any]],
+    ) -> NodeInfo:
+        """Build a NodeInfo from already-extracted node fields."""
+        # Build conditions dict, then derive node status from it
+        conditions_dict: dict[str, str] = {
+            condition["type"]: condition.get("status", "")
+            for condition in conditions
+            if condition.get("type")
+        }
+        node_status = (
+            NodeStatus.READY
+            if conditions_dict.get("Ready") == "True"
+            else NodeStatus.UNKNOWN
+        )
+
+        # Parse node labels for node group
+        node_group = _get_label_value(labels, _NODE_GROUP_LABELS)
+
+        # Get instance type from labels
+        instance_type = _get_label_value(labels, _INSTANCE_TYPE_LABELS)
+
+        # Get availability zone
+        az = _get_label_value(labels, _AZ_LABELS)
+
+        # Parse capacity and allocatable
+        cpu_allocatable = parse_cpu(allocatable.get("cpu", "0")) * 1000
+        memory_allocatable = memory_str_to_bytes(
+            allocatable.get("memory", "0Ki")
+        )
+
+        # Get max pods
+        max_pods_str = allocatable.get("pods", "110")
+        try:
+            pod_capacity = int(float(max_pods_str))
+        except (ValueError, TypeError):
+            pod_capacity = 110
+
+        return NodeInfo(
+            name=name,
+            status=node_status,
+            node_group=node_group,
+            instance_type=instance_type,
+            availability_zone=az,
+            cpu_allocatable=cpu_allocatable,
+            memory_allocatable=memory_allocatable,
+            cpu_requests=0.0,
+            memory_requests=0.0,
+            cpu_limits=0.0,
+            memory_limits=0.0,
+            pod_count=0,
+            pod_capacity=pod_capacity,
+            kubelet_version=kubelet_version,
+            conditions=conditions_dict,
+            taints=taints,
+        )
 
     async def fetch_nodes(self) -> list[NodeInfo]:
         """Fetch and parse kubectl get nodes.
@@ -132,81 +319,6 @@ class NodeFetcher:
         Returns:
             List of NodeInfo objects.
         """
-        items = await self.fetch_nodes_raw()
-
-        nodes = []
-
-        for item in items:
-            metadata = item.get("metadata", {})
-            status = item.get("status", {})
-            spec = item.get("spec", {})
-            labels = metadata.get("labels", {})
-
-            name = metadata.get("name", "Unknown")
-
-            # Determine node status
-            node_status = NodeStatus.UNKNOWN
-            conditions_dict: dict[str, str] = {}
-            for condition in status.get("conditions", []):
-                if (
-                    condition.get("type") == "Ready"
-                    and condition.get("status") == "True"
-                ):
-                    node_status = NodeStatus.READY
-                # Build conditions dict
-                cond_type = condition.get("type")
-                cond_status = condition.get("status", "")
-                if cond_type:
-                    conditions_dict[cond_type] = cond_status
-
-            # Parse node labels for node group
-            node_group = _get_label_value(labels, _NODE_GROUP_LABELS)
-
-            # Get instance type from labels
-            instance_type = _get_label_value(labels, _INSTANCE_TYPE_LABELS)
-
-            # Get availability zone
-            az = _get_label_value(labels, _AZ_LABELS)
-
-            # Parse capacity and allocatable
-            allocatable = status.get("allocatable", {})
-            cpu_allocatable = parse_cpu(allocatable.get("cpu", "0")) * 1000
-            memory_allocatable = memory_str_to_bytes(
-                allocatable.get("memory", "0Ki")
-            )
-
-            # Get max pods
-            max_pods_str = allocatable.get("pods", "110")
-            try:
-                pod_capacity = int(float(max_pods_str))
-            except (ValueError, TypeError):
-                pod_capacity = 110
-
-            # Get kubelet version
-            kubelet_version = status.get("nodeInfo", {}).get("kubeletVersion", "")
-
-            # Get taints
-            taints = spec.get("taints", [])
-
-            nodes.append(
-                NodeInfo(
-                    name=name,
-                    status=node_status,
-                    node_group=node_group,
-                    instance_type=instance_type,
-                    availability_zone=az,
-                    cpu_allocatable=cpu_allocatable,
-                    memory_allocatable=memory_allocatable,
-                    cpu_requests=0.0,
-                    memory_requests=0.0,
-                    cpu_limits=0.0,
-                    memory_limits=0.0,
-                    pod_count=0,
-                    pod_capacity=pod_capacity,
-                    kubelet_version=kubelet_version,
-                    conditions=conditions_dict,
-                    taints=taints,
-                )
-            )
-
-        return nodes
+        return [
+            self._node_info_from_item(item) for item in await self.fetch_node_items()
+        ]
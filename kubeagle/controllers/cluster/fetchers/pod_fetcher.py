@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
+from kubeagle.controllers.cluster.fetchers.decode_cache import DecodedItemsCache
+from kubeagle.controllers.cluster.fetchers.timeout_errors import is_timeout_error
 
 logger = logging.getLogger(__name__)
 
@@ -16,27 +19,27 @@ class PodFetcher:
 
     _PODS_CHUNK_SIZE = 200
     _RETRY_REQUEST_TIMEOUT = "45s"
-    _TIMEOUT_ERROR_TOKENS = (
-        "timed out",
-        "timeout",
-        "deadline exceeded",
-        "i/o timeout",
-        "context deadline exceeded",
-    )
-
-    def __init__(self, run_kubectl_func: Any) -> None:
+
+    def __init__(
+        self,
+        run_kubectl_func: Any,
+        items_cache: DecodedItemsCache | None = None,
+    ) -> None:
         """Initialize with kubectl runner function.
 
         Args:
             run_kubectl_func: Async function to run kubectl commands
+            items_cache: Optional decoded-items cache shared with other fetchers
         """
         self._run_kubectl = run_kubectl_func
+        self._items_cache = (
+            items_cache if items_cache is not None else DecodedItemsCache()
+        )
 
     @classmethod
     def _is_timeout_error(cls, error: Exception) -> bool:
         """Return True when error indicates timeout-like failure."""
-        message = str(error).lower()
-        return any(token in message for token in cls._TIMEOUT_ERROR_TOKENS)
+        return is_timeout_error(error)
 
     def _build_pods_args(
         self,
@@ -46,28 +49,28 @@ class PodFetcher:
         running_only: bool = False,
     ) -> tuple[str, ...]:
         """Build kubectl args for pod fetch query."""
-        args: list[str] = ["get", "pods"]
-        if namespace:
-            args.extend(["-n", namespace])
-        else:
-            args.append("-A")
-        args.extend(
-            [
-                "-o",
-                "json",
-                f"--chunk-size={self._PODS_CHUNK_SIZE}",
-                f"--request-timeout={request_timeout}",
-            ]
+        scope = ("-n", namespace) if namespace else ("-A",)
+        phase_filter = (
+            ("--field-selector=status.phase=Running",) if running_only else ()
+        )
+        return (
+            "get",
+            "pods",
+            *scope,
+            "-o",
+            "json",
+            f"--chunk-size={self._PODS_CHUNK_SIZE}",
+            f"--request-timeout={request_timeout}",
+            *phase_filter,
         )
-        if running_only:
-            args.append("--field-selector=status.phase=Running")
-        return tuple(args)
 
-    @staticmethod
-    def _parse_pod_items(output: str) -> list[dict[str, Any]]:
+    def _parse_pod_items(
+        self,
+        args: tuple[str, ...],
+        output: str,
+    ) -> list[dict[str, Any]]:
         """Parse pod JSON payload into item list."""
-        data = json.loads(output)
-        return data.get("items", [])
+        return self._items_cache.decode_items(args, output)
 
     def _attempt_plan(self, timeout_arg: str) -> list[tuple[str, bool]]:
         """Build timeout/mode attempt plan for pod queries."""
@@ -102,17 +105,16 @@ class PodFetcher:
         last_error: Exception | None = None
         for attempt, (timeout, running_only) in enumerate(attempt_plan, start=1):
             try:
-                output = await self._run_kubectl(
-                    self._build_pods_args(
-                        timeout,
-                        namespace=namespace,
-                        running_only=running_only,
-                    )
+                args = self._build_pods_args(
+                    timeout,
+                    namespace=namespace,
+                    running_only=running_only,
                 )
+                output = await self._run_kubectl(args)
                 if not output:
                     return []
-                return self._parse_pod_items(output)
-            except json.JSONDecodeError:
+                return self._parse_pod_items(args, output)
+            except orjson.JSONDecodeError:
                 logger.exception("Error parsing pods JSON")
                 return []
             except Exception as exc:
@@ -0,0 +1,33 @@
+"""Timeout error detection shared by cluster fetchers."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+
+# Raised directly by the async runner (process timeout) or asyncio wrappers.
+TIMEOUT_EXCEPTION_TYPES: tuple[type[BaseException], ...] = (
+    TimeoutError,
+    asyncio.TimeoutError,
+    subprocess.TimeoutExpired,
+)
+# kubectl reports apiserver-side timeouts only through its stderr text, which
+# the runner surfaces as a generic RuntimeError message. "timeout" also covers
+# "i/o timeout", and "deadline exceeded" covers "context deadline exceeded".
+TIMEOUT_ERROR_TOKENS = (
+    "timed out",
+    "timeout",
+    "deadline exceeded",
+)
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Return True when error indicates timeout-like failure.
+
+    Typed timeout exceptions are matched with ``isinstance`` first; only other
+    errors fall back to scanning the message for kubectl timeout wording.
+    """
+    if isinstance(error, TIMEOUT_EXCEPTION_TYPES):
+        return True
+    message = str(error).lower()
+    return any(token in message for token in TIMEOUT_ERROR_TOKENS)
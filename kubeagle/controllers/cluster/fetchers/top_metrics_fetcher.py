@@ -9,10 +9,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from kubeagle.constants.timeouts import CLUSTER_REQUEST_TIMEOUT
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.controllers.cluster.fetchers.timeout_errors import is_timeout_error
+from kubeagle.utils.resource_parser import (
+    memory_str_to_bytes_cached,
+    parse_cpu_millicores_cached,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,31 +26,21 @@ class TopMetricsFetcher:
     """Fetches node and pod real usage metrics from `kubectl top`."""
 
     _RETRY_REQUEST_TIMEOUT = "45s"
-    _TARGET_TOP_NODE_CHUNK_SIZE = 60
-    _TARGET_TOP_POD_CHUNK_SIZE = 120
-    _TIMEOUT_ERROR_TOKENS = (
-        "timed out",
-        "timeout",
-        "deadline exceeded",
-        "i/o timeout",
-        "context deadline exceeded",
-    )
+    # Per-name `kubectl top` subprocesses allowed to run at once.
+    _MAX_IN_FLIGHT_TOP_CALLS = 16
+    # From this many names, one bulk `kubectl top` call filtered client-side is
+    # cheaper than a subprocess per name.
+    _BULK_TOP_NAME_THRESHOLD = 30
+    # Outputs at least this large are parsed in a worker thread so cluster-wide
+    # `kubectl top` results do not stall the event loop.
+    _THREAD_PARSE_MIN_CHARS = 64 * 1024
 
     def __init__(self, run_kubectl_func: Any) -> None:
         self._run_kubectl = run_kubectl_func
 
     @classmethod
     def _is_timeout_error(cls, error: Exception) -> bool:
-        message = str(error).lower()
-        return any(token in message for token in cls._TIMEOUT_ERROR_TOKENS)
-
-    @staticmethod
-    def _parse_cpu_mcores(cpu_value: str) -> float:
-        return parse_cpu(str(cpu_value or "").strip()) * 1000.0
-
-    @staticmethod
-    def _parse_memory_bytes(memory_value: str) -> float:
-        return memory_str_to_bytes(str(memory_value or "").strip())
+        return is_timeout_error(error)
 
     @staticmethod
     def _build_top_node_args(request_timeout: str) -> tuple[str, ...]:
@@ -96,22 +91,44 @@ class TopMetricsFetcher:
         )
 
     @staticmethod
-    def _clean_names(values: list[str]) -> list[str]:
-        ordered_unique: list[str] = []
-        seen: set[str] = set()
-        for value in values:
-            normalized = str(value or "").strip()
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            ordered_unique.append(normalized)
-        return ordered_unique
+    def _build_top_pod_namespace_args(
+        request_timeout: str,
+        namespace: str,
+    ) -> tuple[str, ...]:
+        return (
+            "top",
+            "pod",
+            "-n",
+            namespace,
+            "--no-headers",
+            f"--request-timeout={request_timeout}",
+        )
 
     @staticmethod
-    def _chunk_names(values: list[str], chunk_size: int) -> list[list[str]]:
-        if not values:
-            return []
-        return [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
+    def _select_rows(
+        rows: list[dict[str, Any]],
+        key: str,
+        names: list[str],
+    ) -> list[dict[str, Any]]:
+        wanted = set(names)
+        rows_by_name = {row[key]: row for row in rows if row[key] in wanted}
+        return [rows_by_name[name] for name in names if name in rows_by_name]
+
+    @staticmethod
+    def _last_row_for_name(
+        rows: list[dict[str, Any]],
+        key: str,
+        name: str,
+    ) -> dict[str, Any] | None:
+        for row in reversed(rows):
+            if row[key] == name:
+                return row
+        return None
+
+    @staticmethod
+    def _clean_names(values: list[str]) -> list[str]:
+        normalized = (str(value or "").strip() for value in values)
+        return list(dict.fromkeys(name for name in normalized if name))
 
     async def _run_with_timeout_retry(
         self,
@@ -153,6 +170,16 @@ class TopMetricsFetcher:
             raise last_error
         return ""
 
+    async def _parse_output(
+        self,
+        parse_func: Callable[..., list[dict[str, Any]]],
+        output: str,
+        *args: Any,
+    ) -> list[dict[str, Any]]:
+        if len(output) >= self._THREAD_PARSE_MIN_CHARS:
+            return await asyncio.to_thread(parse_func, output, *args)
+        return parse_func(output, *args)
+
     def _parse_top_node_lines(self, output: str) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
         for line in output.splitlines():
@@ -161,20 +188,20 @@ class TopMetricsFetcher:
                 continue
             # Expected shape: NAME CPU(cores) CPU% MEMORY(bytes) MEMORY%
             # Some kubectl versions can omit percentages; keep parsing defensive.
-            node_name = str(parts[0]).strip()
-            cpu_token = str(parts[1]).strip()
+            # split() tokens are already non-empty and stripped.
+            node_name, cpu_token = parts[0], parts[1]
             memory_token = ""
             for token in parts[2:]:
                 if not token.endswith("%"):
                     memory_token = token
                     break
-            if not node_name or not cpu_token or not memory_token:
+            if not memory_token:
                 continue
             rows.append(
                 {
                     "node_name": node_name,
-                    "cpu_mcores": self._parse_cpu_mcores(cpu_token),
-                    "memory_bytes": self._parse_memory_bytes(memory_token),
+                    "cpu_mcores": parse_cpu_millicores_cached(cpu_token),
+                    "memory_bytes": memory_str_to_bytes_cached(memory_token),
                 }
             )
         return rows
@@ -186,18 +213,13 @@ class TopMetricsFetcher:
             if len(parts) < 4:
                 continue
             # Expected shape: NAMESPACE NAME CPU(cores) MEMORY(bytes)
-            namespace = str(parts[0]).strip()
-            pod_name = str(parts[1]).strip()
-            cpu_token = str(parts[2]).strip()
-            memory_token = str(parts[3]).strip()
-            if not namespace or not pod_name:
-                continue
+            namespace, pod_name, cpu_token, memory_token = parts[:4]
             rows.append(
                 {
                     "namespace": namespace,
                     "pod_name": pod_name,
-                    "cpu_mcores": self._parse_cpu_mcores(cpu_token),
-                    "memory_bytes": self._parse_memory_bytes(memory_token),
+                    "cpu_mcores": parse_cpu_millicores_cached(cpu_token),
+                    "memory_bytes": memory_str_to_bytes_cached(memory_token),
                 }
             )
         return rows
@@ -217,17 +239,13 @@ class TopMetricsFetcher:
                 continue
             # Expected shape for namespace-scoped top:
             # NAME CPU(cores) MEMORY(bytes)
-            pod_name = str(parts[0]).strip()
-            cpu_token = str(parts[1]).strip()
-            memory_token = str(parts[2]).strip()
-            if not pod_name:
-                continue
+            pod_name, cpu_token, memory_token = parts[:3]
             rows.append(
                 {
                     "namespace": effective_namespace,
                     "pod_name": pod_name,
-                    "cpu_mcores": self._parse_cpu_mcores(cpu_token),
-                    "memory_bytes": self._parse_memory_bytes(memory_token),
+                    "cpu_mcores": parse_cpu_millicores_cached(cpu_token),
+                    "memory_bytes": memory_str_to_bytes_cached(memory_token),
                 }
             )
         return rows
@@ -242,7 +260,7 @@ class TopMetricsFetcher:
         )
         if not output:
             return []
-        return self._parse_top_node_lines(output)
+        return await self._parse_output(self._parse_top_node_lines, output)
 
     async def fetch_top_pods_all_namespaces(
         self,
@@ -254,7 +272,7 @@ class TopMetricsFetcher:
         )
         if not output:
             return []
-        return self._parse_top_pod_lines(output)
+        return await self._parse_output(self._parse_top_pod_lines, output)
 
     async def fetch_top_nodes_for_names(
         self,
@@ -264,34 +282,29 @@ class TopMetricsFetcher:
         names = self._clean_names(node_names)
         if not names:
             return []
+        if len(names) >= self._BULK_TOP_NAME_THRESHOLD:
+            all_rows = await self.fetch_top_nodes(request_timeout=request_timeout)
+            return self._select_rows(all_rows, "node_name", names)
 
-        async def _fetch_single_node(node_name: str) -> list[dict[str, Any]]:
-            output = await self._run_with_timeout_retry(
-                lambda timeout, single_name=node_name: self._build_top_node_name_args(
-                    timeout,
-                    single_name,
-                ),
-                request_timeout=request_timeout,
-            )
+        semaphore = asyncio.Semaphore(self._MAX_IN_FLIGHT_TOP_CALLS)
+
+        async def _fetch_single_node(node_name: str) -> dict[str, Any] | None:
+            async with semaphore:
+                output = await self._run_with_timeout_retry(
+                    lambda timeout, single_name=node_name: self._build_top_node_name_args(
+                        timeout,
+                        single_name,
+                    ),
+                    request_timeout=request_timeout,
+                )
             if not output:
-                return []
-            parsed_rows = self._parse_top_node_lines(output)
-            return [
-                row
-                for row in parsed_rows
-                if str(row.get("node_name", "") or "").strip() == node_name
-            ]
-
-        rows_by_node_name: dict[str, dict[str, Any]] = {}
-        for chunk in self._chunk_names(names, self._TARGET_TOP_NODE_CHUNK_SIZE):
-            results = await asyncio.gather(*[_fetch_single_node(node_name) for node_name in chunk])
-            for rows in results:
-                for row in rows:
-                    node_name = str(row.get("node_name", "") or "").strip()
-                    if not node_name:
-                        continue
-                    rows_by_node_name[node_name] = row
-        return [rows_by_node_name[name] for name in names if name in rows_by_node_name]
+                return None
+            return self._last_row_for_name(
+                self._parse_top_node_lines(output), "node_name", node_name
+            )
+
+        results = await asyncio.gather(*[_fetch_single_node(node_name) for node_name in names])
+        return [row for row in results if row is not None]
 
     async def fetch_top_pods_for_namespace(
         self,
@@ -303,32 +316,42 @@ class TopMetricsFetcher:
         names = self._clean_names(pod_names)
         if not effective_namespace or not names:
             return []
-
-        async def _fetch_single_pod(pod_name: str) -> list[dict[str, Any]]:
+        if len(names) >= self._BULK_TOP_NAME_THRESHOLD:
             output = await self._run_with_timeout_retry(
-                lambda timeout, single_name=pod_name: self._build_top_pod_name_args(
+                lambda timeout: self._build_top_pod_namespace_args(
                     timeout,
                     effective_namespace,
-                    single_name,
                 ),
                 request_timeout=request_timeout,
             )
             if not output:
                 return []
-            parsed_rows = self._parse_top_pod_namespace_lines(output, effective_namespace)
-            return [
-                row
-                for row in parsed_rows
-                if str(row.get("pod_name", "") or "").strip() == pod_name
-            ]
-
-        rows_by_pod_name: dict[str, dict[str, Any]] = {}
-        for chunk in self._chunk_names(names, self._TARGET_TOP_POD_CHUNK_SIZE):
-            results = await asyncio.gather(*[_fetch_single_pod(pod_name) for pod_name in chunk])
-            for rows in results:
-                for row in rows:
-                    pod_name = str(row.get("pod_name", "") or "").strip()
-                    if not pod_name:
-                        continue
-                    rows_by_pod_name[pod_name] = row
-        return [rows_by_pod_name[name] for name in names if name in rows_by_pod_name]
+            all_rows = await self._parse_output(
+                self._parse_top_pod_namespace_lines,
+                output,
+                effective_namespace,
+            )
+            return self._select_rows(all_rows, "pod_name", names)
+
+        semaphore = asyncio.Semaphore(self._MAX_IN_FLIGHT_TOP_CALLS)
+
+        async def _fetch_single_pod(pod_name: str) -> dict[str, Any] | None:
+            async with semaphore:
+                output = await self._run_with_timeout_retry(
+                    lambda timeout, single_name=pod_name: self._build_top_pod_name_args(
+                        timeout,
+                        effective_namespace,
+                        single_name,
+                    ),
+                    request_timeout=request_timeout,
+                )
+            if not output:
+                return None
+            return self._last_row_for_name(
+                self._parse_top_pod_namespace_lines(output, effective_namespace),
+                "pod_name",
+                pod_name,
+            )
+
+        results = await asyncio.gather(*[_fetch_single_pod(pod_name) for pod_name in names])
+        return [row for row in results if row is not None]
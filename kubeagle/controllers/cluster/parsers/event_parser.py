@@ -2,20 +2,80 @@
 
 from __future__ import annotations
 
+import heapq
 import math
+import time
+from collections.abc import Mapping
 from contextlib import suppress
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 from kubeagle.constants.enums import Severity
 from kubeagle.models.events.event_info import EventDetail
 from kubeagle.models.events.event_summary import EventSummary
+from kubeagle.utils.timestamp_parser import parse_iso_epoch, parse_iso_timestamp
+
+# Read-only stand-in for missing nested event objects, so lookups such as
+# ``series.lastObservedTime`` do not build a throwaway dict per event.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
 
 class EventParser:
     """Parses event data into structured formats."""
 
     _DEFAULT_EVENT_WINDOW_HOURS = 0.25  # 15 minutes
+    _NODE_NOT_READY_REASONS = frozenset({"NodeNotReady", "NodeNotSchedulable"})
+    _SCHEDULING_FAILURE_REASONS = frozenset({"FailedScheduling", "FailedCreate"})
+    _FAILED_MOUNT_REASONS = frozenset(
+        {
+            "FailedMount",
+            "FailedAttachVolume",
+            "FailedMapVolume",
+            "VolumeResizeFailed",
+            "FailedBinding",
+        }
+    )
+    _EVICTION_REASONS = frozenset(
+        {
+            "Evicted",
+            "Preempted",
+            "Preempting",
+            "EvictionThresholdMet",
+            "NodePressure",
+        }
+    )
+    # Reason-only buckets keyed by EventSummary counter field. Message keyword
+    # checks (OOM, BackOff, image pull, eviction) are applied in _classify_event.
+    _REASON_BUCKETS: dict[str, str] = {
+        **dict.fromkeys(_NODE_NOT_READY_REASONS, "node_not_ready_count"),
+        **dict.fromkeys(_SCHEDULING_FAILURE_REASONS, "failed_scheduling_count"),
+        "BackOff": "backoff_count",
+        "Unhealthy": "unhealthy_count",
+        **dict.fromkeys(_FAILED_MOUNT_REASONS, "failed_mount_count"),
+        **dict.fromkeys(_EVICTION_REASONS, "evicted_count"),
+    }
+    # Severity reported by parse_critical_events for each critical bucket.
+    _BUCKET_SEVERITY: dict[str, Severity] = {
+        "oom_count": Severity.ERROR,
+        "node_not_ready_count": Severity.ERROR,
+        "failed_scheduling_count": Severity.ERROR,
+        "evicted_count": Severity.ERROR,
+        "backoff_count": Severity.WARNING,
+        "unhealthy_count": Severity.WARNING,
+        "failed_mount_count": Severity.WARNING,
+    }
+    _EVENT_COUNT_FIELDS = (
+        "oom_count",
+        "node_not_ready_count",
+        "failed_scheduling_count",
+        "backoff_count",
+        "unhealthy_count",
+        "failed_mount_count",
+        "evicted_count",
+        "completed_count",
+        "normal_count",
+    )
 
     def __init__(self) -> None:
         """Initialize event parser."""
@@ -24,51 +84,39 @@ class EventParser:
     @staticmethod
     def _parse_iso_timestamp(timestamp: Any) -> datetime | None:
         """Parse kubernetes timestamp strings into aware datetimes."""
-        if not isinstance(timestamp, str) or not timestamp:
-            return None
-        with suppress(ValueError, TypeError):
-            return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        return None
-
-    def _parse_event_timestamp(self, event: dict[str, Any]) -> tuple[str | None, datetime | None]:
-        """Extract timestamp string and parsed datetime from event.
+        return parse_iso_timestamp(timestamp)
 
-        Returns:
-            Tuple of (timestamp_str, parsed_datetime or None)
-        """
-        event_time_str = (
-            event.get("series", {}).get("lastObservedTime")
+    @staticmethod
+    def _last_seen_raw(event: dict[str, Any]) -> Any:
+        """Return the raw last-seen timestamp across legacy and events.k8s.io shapes."""
+        return (
+            (event.get("series") or _EMPTY_MAPPING).get("lastObservedTime")
             or event.get("lastTimestamp")
             or event.get("deprecatedLastTimestamp")
             or event.get("eventTime")
-            or event.get("metadata", {}).get("creationTimestamp")
+            or (event.get("metadata") or _EMPTY_MAPPING).get("creationTimestamp")
         )
-        event_datetime = self._parse_iso_timestamp(event_time_str)
-
-        return event_time_str, event_datetime
 
     @staticmethod
-    def _first_seen_timestamp(event: dict[str, Any]) -> datetime | None:
-        """Resolve first-seen timestamp across legacy and events.k8s.io shapes."""
-        first_seen_raw = (
+    def _first_seen_raw(event: dict[str, Any]) -> Any:
+        """Return the raw first-seen timestamp across legacy and events.k8s.io shapes."""
+        return (
             event.get("firstTimestamp")
             or event.get("deprecatedFirstTimestamp")
             or event.get("eventTime")
-            or event.get("metadata", {}).get("creationTimestamp")
+            or (event.get("metadata") or _EMPTY_MAPPING).get("creationTimestamp")
         )
-        return EventParser._parse_iso_timestamp(first_seen_raw)
 
-    @staticmethod
-    def _last_seen_timestamp(event: dict[str, Any]) -> datetime | None:
-        """Resolve last-seen timestamp across legacy and events.k8s.io shapes."""
-        last_seen_raw = (
-            event.get("series", {}).get("lastObservedTime")
-            or event.get("lastTimestamp")
-            or event.get("deprecatedLastTimestamp")
-            or event.get("eventTime")
-            or event.get("metadata", {}).get("creationTimestamp")
-        )
-        return EventParser._parse_iso_timestamp(last_seen_raw)
+    def _parse_event_timestamp(self, event: dict[str, Any]) -> tuple[str | None, datetime | None]:
+        """Extract timestamp string and parsed datetime from event.
+
+        Returns:
+            Tuple of (timestamp_str, parsed_datetime or None)
+        """
+        event_time_str = self._last_seen_raw(event)
+        event_datetime = self._parse_iso_timestamp(event_time_str)
+
+        return event_time_str, event_datetime
 
     @staticmethod
     def _parse_event_count(event: dict[str, Any]) -> int:
@@ -76,7 +124,7 @@ class EventParser:
         raw_value = (
             event.get("count")
             or event.get("deprecatedCount")
-            or event.get("series", {}).get("count")
+            or (event.get("series") or _EMPTY_MAPPING).get("count")
             or 1
         )
         with suppress(ValueError, TypeError):
@@ -88,34 +136,37 @@ class EventParser:
         cls,
         event: dict[str, Any],
         *,
-        now: datetime,
-        max_age_seconds: float,
-        event_datetime: datetime | None = None,
+        cutoff_ts: float,
+        event_ts: float | None = None,
     ) -> int:
-        """Estimate how many repeated occurrences happened within the lookback window."""
+        """Estimate how many repeated occurrences happened within the lookback window.
+
+        Args:
+            event: Event dictionary.
+            cutoff_ts: Start of the lookback window as epoch seconds.
+            event_ts: Pre-parsed last-seen epoch seconds, if already known.
+        """
         total_count = cls._parse_event_count(event)
         if total_count <= 1:
             return total_count
 
-        last_seen = event_datetime or cls._last_seen_timestamp(event)
+        last_seen = (
+            event_ts if event_ts is not None else parse_iso_epoch(cls._last_seen_raw(event))
+        )
         if last_seen is None:
             return total_count
 
-        cutoff = now - timedelta(seconds=max_age_seconds)
-        if last_seen < cutoff:
+        if last_seen < cutoff_ts:
             return 0
 
-        first_seen = cls._first_seen_timestamp(event)
+        first_seen = parse_iso_epoch(cls._first_seen_raw(event))
         if first_seen is None or last_seen <= first_seen:
             return total_count
-        if first_seen >= cutoff:
-            return total_count
-
-        span_seconds = (last_seen - first_seen).total_seconds()
-        if span_seconds <= 0:
+        if first_seen >= cutoff_ts:
             return total_count
 
-        overlap_seconds = (last_seen - cutoff).total_seconds()
+        span_seconds = last_seen - first_seen
+        overlap_seconds = last_seen - cutoff_ts
         scaled_count = math.ceil(total_count * (overlap_seconds / span_seconds))
         return max(1, min(total_count, scaled_count))
 
@@ -129,11 +180,11 @@ class EventParser:
 
     def _is_node_not_ready_event(self, reason: str, involved_kind: str) -> bool:
         """Check if event indicates node not ready."""
-        return involved_kind == "Node" and reason in ("NodeNotReady", "NodeNotSchedulable")
+        return involved_kind == "Node" and reason in self._NODE_NOT_READY_REASONS
 
     def _is_scheduling_failure(self, reason: str) -> bool:
         """Check if event indicates scheduling failure."""
-        return reason in ("FailedScheduling", "FailedCreate")
+        return reason in self._SCHEDULING_FAILURE_REASONS
 
     def _is_backoff_event(self, reason: str, message: str) -> bool:
         """Check if event is a BackOff event."""
@@ -149,27 +200,47 @@ class EventParser:
 
     def _is_failed_mount_event(self, reason: str) -> bool:
         """Check if event indicates volume mount failure."""
-        return reason in (
-            "FailedMount",
-            "FailedAttachVolume",
-            "FailedMapVolume",
-            "VolumeResizeFailed",
-            "FailedBinding",
-        )
+        return reason in self._FAILED_MOUNT_REASONS
 
     def _is_eviction_event(self, reason: str, message: str) -> bool:
         """Check if event indicates pod eviction."""
-        return (
-            reason
-            in (
-                "Evicted",
-                "Preempted",
-                "Preempting",
-                "EvictionThresholdMet",
-                "NodePressure",
-            )
-            or "evict" in message.lower()
-        )
+        return reason in self._EVICTION_REASONS or "evict" in message.lower()
+
+    @classmethod
+    def _classify_event(
+        cls,
+        reason: str,
+        message: str,
+        involved_kind: str,
+    ) -> str | None:
+        """Return the critical bucket for an event, or None when not critical.
+
+        Equivalent to walking the ``_is_*`` checks in precedence order, but does
+        one reason lookup and lowercases the message at most once, only for
+        events whose reason has no bucket.
+        """
+        if reason == "OOMKilling" or "OOMKill" in message or "Out of memory" in message:
+            return "oom_count"
+        bucket = cls._REASON_BUCKETS.get(reason)
+        if bucket == "node_not_ready_count":
+            if involved_kind == "Node":
+                return bucket
+            bucket = None
+        elif bucket in ("failed_scheduling_count", "backoff_count"):
+            return bucket
+        if "BackOff" in message:
+            return "backoff_count"
+        # No bucketed reason is "Failed", so the image-pull probe cannot
+        # pre-empt a reason match and the message is only lowercased for
+        # events without one.
+        if bucket is not None:
+            return bucket
+        message_lower = message.lower()
+        if reason == "Failed" and "pull" in message_lower:
+            return "backoff_count"
+        if "evict" in message_lower:
+            return "evicted_count"
+        return None
 
     def parse_events_summary(
         self,
@@ -187,82 +258,62 @@ class EventParser:
         Returns:
             EventSummary object.
         """
-        now = datetime.now(timezone.utc)
-        max_age_seconds = max_age_hours * 3600
-
-        oom_count = 0
-        node_not_ready_count = 0
-        failed_scheduling_count = 0
-        backoff_count = 0
-        unhealthy_count = 0
-        failed_mount_count = 0
-        evicted_count = 0
-        completed_count = 0
-        normal_count = 0
-
-        recent_events: list[dict[str, str]] = []
-        events_with_time: list[tuple[datetime, dict[str, Any]]] = []
+        now_ts = time.time()
+        cutoff_ts = now_ts - max_age_hours * 3600
+
+        counts = dict.fromkeys(self._EVENT_COUNT_FIELDS, 0)
+
+        # Min-heap of the newest ``max_recent_events`` entries keyed on
+        # (timestamp, -sequence): the root is the oldest kept entry, and on
+        # equal timestamps earlier events win, matching a stable sort.
+        recent_heap: list[tuple[float, int, dict[str, str]]] = []
+        sequence = 0
 
         for event in events:
-            event_time_str, event_datetime = self._parse_event_timestamp(event)
+            event_time_str = self._last_seen_raw(event)
+            event_ts = parse_iso_epoch(event_time_str)
 
-            if event_datetime:
-                age_seconds = (now - event_datetime).total_seconds()
-                if age_seconds < 0 or age_seconds > max_age_seconds:
-                    continue
+            if event_ts is not None and not cutoff_ts <= event_ts <= now_ts:
+                continue
 
             reason = event.get("reason", "")
             message = event.get("message", "")
             event_type = event.get("type", "Normal")
             event_count = self._parse_event_count_in_window(
                 event,
-                now=now,
-                max_age_seconds=max_age_seconds,
-                event_datetime=event_datetime,
+                cutoff_ts=cutoff_ts,
+                event_ts=event_ts,
             )
             if event_count <= 0:
                 continue
-            involved_object = event.get("involvedObject", {})
-
-            is_critical = False
-
-            if self._is_oom_event(reason, message):
-                oom_count += event_count
-                is_critical = True
-            elif self._is_node_not_ready_event(reason, involved_object.get("kind", "")):
-                node_not_ready_count += event_count
-                is_critical = True
-            elif self._is_scheduling_failure(reason):
-                failed_scheduling_count += event_count
-                is_critical = True
-            elif self._is_backoff_event(reason, message):
-                backoff_count += event_count
-                is_critical = True
-            elif self._is_unhealthy_event(reason):
-                unhealthy_count += event_count
-                is_critical = True
-            elif self._is_failed_mount_event(reason):
-                failed_mount_count += event_count
-                is_critical = True
-            elif self._is_eviction_event(reason, message):
-                evicted_count += event_count
-                is_critical = True
-            elif reason == "Completed":
-                completed_count += event_count
-            elif event_type == "Normal":
-                normal_count += event_count
-            else:
-                if event_type == "Warning":
-                    backoff_count += event_count
+            involved_object = event.get("involvedObject") or _EMPTY_MAPPING
+            obj_kind = involved_object.get("kind", "")
+
+            bucket = self._classify_event(reason, message, obj_kind)
+            is_critical = bucket is not None
+            if bucket is None:
+                if reason == "Completed":
+                    bucket = "completed_count"
+                elif event_type == "Warning":
+                    bucket = "backoff_count"
                 else:
-                    normal_count += event_count
+                    bucket = "normal_count"
+            counts[bucket] += event_count
 
-            if event_datetime is not None and (
-                is_critical or event_type == "Warning" or event_count > 1
+            if (
+                max_recent_events > 0
+                and event_ts is not None
+                and (is_critical or event_type == "Warning" or event_count > 1)
             ):
+                sequence += 1
+                if len(recent_heap) >= max_recent_events and (
+                    event_ts,
+                    -sequence,
+                ) <= recent_heap[0][:2]:
+                    continue
+
                 obj_name = involved_object.get("name", "")
                 obj_namespace = involved_object.get("namespace", "")
-                obj_kind = involved_object.get("kind", "")
 
                 if obj_kind == "Node":
                     involved = f"Node/{obj_name}"
@@ -273,46 +324,28 @@ class EventParser:
                 else:
                     involved = obj_kind
 
-                events_with_time.append(
-                    (
-                        event_datetime,
-                        {
-                            "type": event_type,
-                            "reason": reason,
-                            "message": message[:100] if len(message) > 100 else message,
-                            "count": str(event_count),
-                            "last_timestamp": event_time_str or "",
-                            "involved_object": involved,
-                        },
-                    )
+                entry = (
+                    event_ts,
+                    -sequence,
+                    {
+                        "type": event_type,
+                        "reason": reason,
+                        "message": message[:100],
+                        "count": str(event_count),
+                        "last_timestamp": event_time_str or "",
+                        "involved_object": involved,
+                    },
                 )
+                if len(recent_heap) < max_recent_events:
+                    heapq.heappush(recent_heap, entry)
+                else:
+                    heapq.heapreplace(recent_heap, entry)
 
-        events_with_time.sort(key=lambda x: x[0], reverse=True)
-        recent_events = [e[1] for e in events_with_time[:max_recent_events]]
-
-        total_count = (
-            oom_count
-            + node_not_ready_count
-            + failed_scheduling_count
-            + backoff_count
-            + unhealthy_count
-            + failed_mount_count
-            + evicted_count
-            + completed_count
-            + normal_count
-        )
+        recent_events = [e[2] for e in sorted(recent_heap, reverse=True)]
 
         return EventSummary(
-            total_count=total_count,
-            oom_count=oom_count,
-            node_not_ready_count=node_not_ready_count,
-            failed_scheduling_count=failed_scheduling_count,
-            backoff_count=backoff_count,
-            unhealthy_count=unhealthy_count,
-            failed_mount_count=failed_mount_count,
-            evicted_count=evicted_count,
-            completed_count=completed_count,
-            normal_count=normal_count,
+            total_count=sum(counts.values()),
+            **counts,
             recent_events=recent_events,
             max_age_hours=max_age_hours,
             desired_healthy=0,
@@ -334,80 +367,69 @@ class EventParser:
         Returns:
             List of EventDetail objects.
         """
-        now = datetime.now(timezone.utc)
-        max_age_seconds = max_age_hours * 3600
+        if limit <= 0:
+            return []
+
+        now_ts = time.time()
+        cutoff_ts = now_ts - max_age_hours * 3600
 
         critical_events: list[EventDetail] = []
 
         for event in events:
-            event_time_str, event_datetime = self._parse_event_timestamp(event)
+            event_time_str = self._last_seen_raw(event)
+            event_ts = parse_iso_epoch(event_time_str)
 
-            if event_datetime:
-                age_seconds = (now - event_datetime).total_seconds()
-                if age_seconds < 0 or age_seconds > max_age_seconds:
-                    continue
+            if event_ts is not None and not cutoff_ts <= event_ts <= now_ts:
+                continue
 
             reason = event.get("reason", "")
             message = event.get("message", "")
             event_type = event.get("type", "Normal")
+            involved_object = event.get("involvedObject") or _EMPTY_MAPPING
+            obj_kind = involved_object.get("kind", "")
+
+            # Only critical or Warning events are reported; decide that before
+            # estimating counts or building any output strings.
+            bucket = self._classify_event(reason, message, obj_kind)
+            if bucket is None and event_type != "Warning":
+                continue
+
             event_count = self._parse_event_count_in_window(
                 event,
-                now=now,
-                max_age_seconds=max_age_seconds,
-                event_datetime=event_datetime,
+                cutoff_ts=cutoff_ts,
+                event_ts=event_ts,
             )
             if event_count <= 0:
                 continue
-            involved_object = event.get("involvedObject", {})
-            source = event.get("source", {}).get("component", "unknown")
-
-            is_critical = False
-            severity = Severity.INFO
-
-            if (
-                self._is_oom_event(reason, message)
-                or self._is_node_not_ready_event(reason, involved_object.get("kind", ""))
-                or self._is_scheduling_failure(reason)
-            ):
-                is_critical = True
-                severity = Severity.ERROR
-            elif (
-                self._is_backoff_event(reason, message)
-                or self._is_unhealthy_event(reason)
-                or self._is_failed_mount_event(reason)
-            ):
-                is_critical = True
-                severity = Severity.WARNING
-            elif self._is_eviction_event(reason, message):
-                is_critical = True
-                severity = Severity.ERROR
-
-            if is_critical or event_type == "Warning":
-                obj_name = involved_object.get("name", "")
-                obj_namespace = involved_object.get("namespace", "")
-                obj_kind = involved_object.get("kind", "")
-
-                if obj_kind == "Node":
-                    involved = obj_name
-                elif obj_namespace and obj_name:
-                    involved = f"{obj_namespace}/{obj_name}"
-                elif obj_name:
-                    involved = obj_name
-                else:
-                    involved = obj_kind
 
-                critical_events.append(
-                    EventDetail(
-                        type=event_type,
-                        reason=reason,
-                        message=message,
-                        count=event_count,
-                        last_timestamp=event_time_str or "",
-                        source=source,
-                        involved_object=involved,
-                        severity=severity.value if isinstance(severity, Severity) else str(severity),
-                    )
+            severity = (
+                self._BUCKET_SEVERITY[bucket] if bucket is not None else Severity.INFO
+            )
+            source = (event.get("source") or _EMPTY_MAPPING).get("component", "unknown")
+            obj_name = involved_object.get("name", "")
+            obj_namespace = involved_object.get("namespace", "")
+
+            if obj_kind == "Node":
+                involved = obj_name
+            elif obj_namespace and obj_name:
+                involved = f"{obj_namespace}/{obj_name}"
+            elif obj_name:
+                involved = obj_name
+            else:
+                involved = obj_kind
+
+            critical_events.append(
+                EventDetail(
+                    type=event_type,
+                    reason=reason,
+                    message=message,
+                    count=event_count,
+                    last_timestamp=event_time_str or "",
+                    source=source,
+                    involved_object=involved,
+                    severity=severity.value,
                 )
+            )
 
             if len(critical_events) >= limit:
                 break
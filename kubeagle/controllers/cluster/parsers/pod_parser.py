@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+import heapq
+from collections import defaultdict
+from operator import attrgetter
+from typing import Any, NamedTuple
 
 from kubeagle.models.teams.distribution import PodDistributionInfo
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import (
+    memory_str_to_bytes_cached,
+    parse_cpu_millicores_cached,
+)
+
+
+class _NodePodInfo(NamedTuple):
+    name: str
+    node_group: str
+    pod_count: int
 
 
 class PodParser:
@@ -18,6 +30,7 @@ class PodParser:
         "karpenter.sh/provisioner-name",
         "kops.k8s.io/instancegroup",
     )
+    _SCHEDULED_PHASES = frozenset({"Running", "Pending"})
 
     def __init__(self) -> None:
         """Initialize pod parser."""
@@ -27,6 +40,8 @@ class PodParser:
         self, labels: dict[str, str], label_tuples: tuple[str, ...], default: str = "Unknown"
     ) -> str:
         """Extract label value from labels dict using ordered label tuples."""
+        if not labels:
+            return default
         for label in label_tuples:
             value = labels.get(label)
             if value:
@@ -45,10 +60,14 @@ class PodParser:
             Dictionary mapping node name to list of pods.
         """
         pods_by_node: dict[str, list[dict[str, Any]]] = {}
+        scheduled_phases = self._SCHEDULED_PHASES
         for pod in pods:
-            if pod.get("status", {}).get("phase") in ("Running", "Pending") and (
-                node_name := pod.get("spec", {}).get("nodeName")
-            ):
+            status = pod.get("status")
+            if not status or status.get("phase") not in scheduled_phases:
+                continue
+            spec = pod.get("spec")
+            node_name = spec.get("nodeName") if spec else None
+            if node_name:
                 pods_by_node.setdefault(node_name, []).append(pod)
         return pods_by_node
 
@@ -69,68 +88,58 @@ class PodParser:
         pods_by_node = self.parse_pods_by_node(pods)
 
         # Collect node info and pod counts
-        node_info_by_name: dict[str, dict[str, Any]] = {}
+        node_info_by_name: dict[str, _NodePodInfo] = {}
         pod_counts: list[int] = []
+        node_group_labels = self._NODE_GROUP_LABELS
+        get_label_value = self._get_label_value
 
         for node in nodes:
             metadata = node.get("metadata", {})
             labels = metadata.get("labels", {})
 
             node_name = metadata.get("name", "Unknown")
-            node_group = self._get_label_value(labels, self._NODE_GROUP_LABELS)
+            node_group = get_label_value(labels, node_group_labels)
 
-            node_pods = pods_by_node.get(node_name, [])
-            pod_count = len(node_pods)
+            pod_count = len(pods_by_node.get(node_name, ()))
             pod_counts.append(pod_count)
 
-            node_info_by_name[node_name] = {
-                "name": node_name,
-                "node_group": node_group,
-                "pod_count": pod_count,
-            }
-
-        # Calculate statistics
-        total_pods = sum(pod_counts)
-        min_pods = min(pod_counts) if pod_counts else 0
-        max_pods = max(pod_counts) if pod_counts else 0
-        avg_pods = sum(pod_counts) / len(pod_counts) if pod_counts else 0.0
+            node_info_by_name[node_name] = _NodePodInfo(
+                node_name, node_group, pod_count
+            )
 
-        # Calculate P95
+        # Calculate statistics; one sort yields min, max and P95
         sorted_counts = sorted(pod_counts)
+        total_pods = sum(sorted_counts)
+        min_pods = sorted_counts[0] if sorted_counts else 0
+        max_pods = sorted_counts[-1] if sorted_counts else 0
+        avg_pods = total_pods / len(sorted_counts) if sorted_counts else 0.0
         p95_idx = int(len(sorted_counts) * 0.95)
         p95_pods = sorted_counts[p95_idx] if sorted_counts else 0
 
-        # Find high pod nodes (top 10)
-        high_pod_nodes = []
-        for node_name in sorted(
-            node_info_by_name.keys(),
-            key=lambda n: node_info_by_name[n]["pod_count"],
-            reverse=True,
-        )[:10]:
-            info = node_info_by_name[node_name]
-            high_pod_nodes.append(
-                {
-                    "name": info["name"],
-                    "node_group": info["node_group"],
-                    "pod_count": info["pod_count"],
-                    "cpu_pct": 0.0,
-                    "mem_pct": 0.0,
-                }
+        # Find high pod nodes (top 10); nlargest keeps the stable-sort tie order
+        high_pod_nodes = [
+            {
+                "name": info.name,
+                "node_group": info.node_group,
+                "pod_count": info.pod_count,
+                "cpu_pct": 0.0,
+                "mem_pct": 0.0,
+            }
+            for info in heapq.nlargest(
+                10, node_info_by_name.values(), key=attrgetter("pod_count")
             )
+        ]
 
         # Group by node group
-        by_node_group: dict[str, dict[str, Any]] = {}
-        for info in node_info_by_name.values():
-            ng = info["node_group"]
-            if ng not in by_node_group:
-                by_node_group[ng] = {
-                    "node_count": 0,
-                    "total_pods": 0,
-                    "pod_counts": [],
-                }
-            by_node_group[ng]["node_count"] += 1
-            by_node_group[ng]["total_pods"] += info["pod_count"]
-            by_node_group[ng]["pod_counts"].append(info["pod_count"])
+        group_totals: defaultdict[str, dict[str, Any]] = defaultdict(
+            lambda: {"node_count": 0, "total_pods": 0, "pod_counts": []}
+        )
+        for _, node_group, pod_count in node_info_by_name.values():
+            group = group_totals[node_group]
+            group["node_count"] += 1
+            group["total_pods"] += pod_count
+            group["pod_counts"].append(pod_count)
+        by_node_group: dict[str, dict[str, Any]] = dict(group_totals)
 
         # Calculate averages per node group
         for ng_data in by_node_group.values():
@@ -149,6 +158,21 @@ class PodParser:
             by_node_group=by_node_group,
         )
 
+    @staticmethod
+    def _calc_stats(values: list[float]) -> dict[str, float]:
+        """Return min/avg/max/P95 of values from a single in-place sort."""
+        if not values:
+            return {"min": 0, "avg": 0.0, "max": 0, "p95": 0}
+
+        values.sort()
+        count = len(values)
+        return {
+            "min": values[0],
+            "avg": sum(values) / count,
+            "max": values[-1],
+            "p95": values[int(count * 0.95)],
+        }
+
     def parse_pod_requests(
         self, pods: list[dict[str, Any]]
     ) -> dict[str, dict[str, float]]:
@@ -160,71 +184,60 @@ class PodParser:
         Returns:
             Dictionary with request/limit statistics for CPU and memory.
         """
-        cpu_requests_by_node: dict[str, list[float]] = {}
-        memory_requests_by_node: dict[str, list[float]] = {}
-        cpu_limits_by_node: dict[str, list[float]] = {}
-        memory_limits_by_node: dict[str, list[float]] = {}
+        # Statistics never use node identity, so totals go into flat buffers.
+        cpu_requests: list[float] = []
+        memory_requests: list[float] = []
+        cpu_limits: list[float] = []
+        memory_limits: list[float] = []
 
+        scheduled_phases = self._SCHEDULED_PHASES
         for pod in pods:
-            pod_status = pod.get("status", {})
-            if pod_status.get("phase") not in ("Running", "Pending"):
+            pod_status = pod.get("status")
+            if not pod_status or pod_status.get("phase") not in scheduled_phases:
                 continue
 
-            node_name = pod.get("spec", {}).get("nodeName", "Unknown")
-            pod_spec = pod.get("spec", {})
+            pod_spec = pod.get("spec") or {}
 
             node_cpu_request_total = 0.0
             node_mem_request_total = 0.0
             node_cpu_limit_total = 0.0
             node_mem_limit_total = 0.0
 
-            for container in pod_spec.get("containers", []):
-                resources = container.get("resources", {})
-                requests = resources.get("requests", {})
-                limits = resources.get("limits", {})
-
-                cpu_str = requests.get("cpu", "0")
-                mem_str = requests.get("memory", "0Ki")
-                cpu_limit_str = limits.get("cpu", "0")
-                mem_limit_str = limits.get("memory", "0Ki")
-
-                node_cpu_request_total += parse_cpu(cpu_str) * 1000
-                node_mem_request_total += memory_str_to_bytes(mem_str)
-                node_cpu_limit_total += parse_cpu(cpu_limit_str) * 1000
-                node_mem_limit_total += memory_str_to_bytes(mem_limit_str)
+            for container in pod_spec.get("containers") or ():
+                resources = container.get("resources")
+                if not resources:
+                    continue
+                # Unset quantities parse to zero, so only present ones are parsed.
+                if requests := resources.get("requests"):
+                    if cpu_str := requests.get("cpu"):
+                        node_cpu_request_total += parse_cpu_millicores_cached(cpu_str)
+                    if mem_str := requests.get("memory"):
+                        node_mem_request_total += memory_str_to_bytes_cached(mem_str)
+                if limits := resources.get("limits"):
+                    if cpu_limit_str := limits.get("cpu"):
+                        node_cpu_limit_total += parse_cpu_millicores_cached(cpu_limit_str)
+                    if mem_limit_str := limits.get("memory"):
+                        node_mem_limit_total += memory_str_to_bytes_cached(
+                            mem_limit_str
+                        )
 
             if node_cpu_request_total > 0:
-                cpu_requests_by_node.setdefault(node_name, []).append(node_cpu_request_total)
+                cpu_requests.append(node_cpu_request_total)
             if node_mem_request_total > 0:
-                memory_requests_by_node.setdefault(node_name, []).append(node_mem_request_total)
+                memory_requests.append(node_mem_request_total)
             if node_cpu_limit_total > 0:
-                cpu_limits_by_node.setdefault(node_name, []).append(node_cpu_limit_total)
+                cpu_limits.append(node_cpu_limit_total)
             if node_mem_limit_total > 0:
-                memory_limits_by_node.setdefault(node_name, []).append(node_mem_limit_total)
-
-        def calc_stats(data_dict: dict[str, list[float]]) -> dict[str, float]:
-            all_values = [v for vals in data_dict.values() for v in vals]
-            if not all_values:
-                return {"min": 0, "avg": 0.0, "max": 0, "p95": 0}
-
-            sorted_values = sorted(all_values)
-            p95_idx = int(len(sorted_values) * 0.95)
-
-            return {
-                "min": min(all_values),
-                "avg": sum(all_values) / len(all_values),
-                "max": max(all_values),
-                "p95": sorted_values[p95_idx] if sorted_values else 0,
-            }
+                memory_limits.append(node_mem_limit_total)
 
-        cpu_request_stats = calc_stats(cpu_requests_by_node)
-        memory_request_stats = calc_stats(memory_requests_by_node)
+        cpu_request_stats = self._calc_stats(cpu_requests)
+        memory_request_stats = self._calc_stats(memory_requests)
 
         return {
             "cpu_request_stats": cpu_request_stats,
             "memory_request_stats": memory_request_stats,
-            "cpu_limit_stats": calc_stats(cpu_limits_by_node),
-            "memory_limit_stats": calc_stats(memory_limits_by_node),
+            "cpu_limit_stats": self._calc_stats(cpu_limits),
+            "memory_limit_stats": self._calc_stats(memory_limits),
             # Backward-compatible aliases used in existing presenter/tests.
             "cpu_stats": cpu_request_stats,
             "memory_stats": memory_request_stats,
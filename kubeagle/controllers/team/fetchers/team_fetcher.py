@@ -24,6 +24,8 @@ class TeamFetcher:
         self.codeowners_path = codeowners_path
         self.teams: list[TeamInfo] = []
         self.team_mapping: dict[str, str] = {}
+        # Distinct mapping key lengths, longest first; built lazily on lookup.
+        self._prefix_lengths: list[int] | None = None
 
     def load_codeowners(self, codeowners_path: Path) -> None:
         """Load and parse a CODEOWNERS file.
@@ -33,6 +35,7 @@ class TeamFetcher:
         """
         self.teams = []
         self.team_mapping = {}
+        self._prefix_lengths = None
         self._parse_codeowners(codeowners_path)
 
     def _parse_codeowners(self, path: Path) -> None:
@@ -45,118 +48,113 @@ class TeamFetcher:
             return
 
         try:
-            with open(path, encoding="utf-8") as f:
-                current_team = "Unknown"
-                current_team_ref: str | None = None
-                current_owners: list[str] = []
-
-                for raw_line in f:
-                    line = raw_line.strip()
-
-                    # Skip empty lines
-                    if not line:
-                        continue
-
-                    # Handle team header comments
-                    if line.startswith("#"):
-                        # Check for team separator (======)
-                        if "=======" in line:
-                            continue
-
-                        # Look for team name in comment using TEAM_PATTERN
-                        match = TEAM_PATTERN.search(line)
-                        if match:
-                            team_name = match.group(1)
-                            # Normalize team names (CLI compatibility)
-                            current_team = self._normalize_team_name(team_name)
-                            current_team_ref = team_name
-
-                            # Extract owners if specified in the comment
-                            current_owners = self._extract_owners_from_line(line)
-                        else:
-                            # Try GitHub team pattern (@org/team)
-                            github_match = GITHUB_TEAM_PATTERN.search(line)
-                            if github_match:
-                                team_name = github_match.group(1)
-                                # Handle org/team format
-                                if "/" in team_name:
-                                    current_team = (
-                                        team_name.split("/")[-1]
-                                        .replace("-", " ")
-                                        .title()
-                                    )
-                                    current_team_ref = team_name
-                                else:
-                                    current_team = team_name.replace("-", " ").title()
-                                    current_team_ref = team_name
-                        continue
-
-                    # Parse directory mapping
-                    parts = line.split()
-
-                    if not parts:
-                        continue
-
-                    path_pattern = parts[0]
-
-                    # Skip regex patterns (lines starting with ^)
-                    if path_pattern.startswith("^"):
-                        continue
-
-                    # Extract owners from this line
-                    line_owners = self._extract_owners_from_line(" ".join(parts[1:]))
-
-                    # If no team context from comment, try to extract from owners
-                    if current_team == "Unknown" and line_owners:
-                        current_team = self._extract_team_from_owner(line_owners[0])
-
-                    # Normalize path pattern
-                    normalized_pattern = path_pattern.lstrip("/")
-
-                    # Handle glob patterns like **/charts/
-                    if "**" in normalized_pattern:
-                        normalized_pattern = normalized_pattern.split("**/")[-1]
-
-                    # Store team info
-                    team_info = TeamInfo(
-                        name=current_team,
-                        pattern=normalized_pattern,
-                        owners=line_owners or current_owners,
-                        team_ref=current_team_ref,
-                    )
-                    self.teams.append(team_info)
-
-                    # Build path -> team mapping
-                    if normalized_pattern.endswith("/"):
-                        dir_name = normalized_pattern.rstrip("/")
-                        self.team_mapping[dir_name] = current_team
-                    elif "*" in normalized_pattern:
-                        prefix = normalized_pattern.rstrip("*")
-                        if prefix:
-                            self.team_mapping[prefix] = current_team
-                    else:
-                        self.team_mapping[normalized_pattern] = current_team
-
+            text = path.read_text(encoding="utf-8")
         except OSError:
             return
 
+        current_team = "Unknown"
+        current_team_ref: str | None = None
+        current_owners: list[str] = []
+        # Monorepo CODEOWNERS repeat the same owner list on most lines.
+        owners_by_text: dict[str, list[str]] = {}
+
+        # Text mode already translated newlines, so "\n" is the only separator.
+        for raw_line in text.split("\n"):
+            line = raw_line.strip()
+
+            # Skip empty lines
+            if not line:
+                continue
+
+            # Handle team header comments
+            if line.startswith("#"):
+                # Check for team separator (======)
+                if "=======" in line:
+                    continue
+
+                # Look for team name in comment using TEAM_PATTERN
+                match = TEAM_PATTERN.search(line)
+                if match:
+                    team_name = match.group(1)
+                    # Normalize team names (CLI compatibility)
+                    current_team = self._normalize_team_name(team_name)
+                    current_team_ref = team_name
+
+                    # Extract owners if specified in the comment
+                    current_owners = self._extract_owners_from_line(line)
+                else:
+                    # Try GitHub team pattern (@org/team)
+                    github_match = GITHUB_TEAM_PATTERN.search(line)
+                    if github_match:
+                        team_name = github_match.group(1)
+                        # Handle org/team format
+                        if "/" in team_name:
+                            current_team = (
+                                team_name.split("/")[-1]
+                                .replace("-", " ")
+                                .title()
+                            )
+                            current_team_ref = team_name
+                        else:
+                            current_team = team_name.replace("-", " ").title()
+                            current_team_ref = team_name
+                continue
+
+            # Parse directory mapping; the stripped line has at least one field
+            path_pattern, *rest = line.split(None, 1)
+
+            # Skip regex patterns (lines starting with ^)
+            if path_pattern.startswith("^"):
+                continue
+
+            # Extract owners from this line
+            owners_text = rest[0] if rest else ""
+            line_owners = owners_by_text.get(owners_text)
+            if line_owners is None:
+                line_owners = self._extract_owners_from_line(owners_text)
+                owners_by_text[owners_text] = line_owners
+
+            # If no team context from comment, try to extract from owners
+            if current_team == "Unknown" and line_owners:
+                current_team = self._extract_team_from_owner(line_owners[0])
+
+            # Normalize path pattern
+            normalized_pattern = path_pattern.lstrip("/")
+
+            # Handle glob patterns like **/charts/
+            if "**" in normalized_pattern:
+                normalized_pattern = normalized_pattern.split("**/")[-1]
+
+            # Store team info
+            team_info = TeamInfo(
+                name=current_team,
+                pattern=normalized_pattern,
+                owners=line_owners or current_owners,
+                team_ref=current_team_ref,
+            )
+            self.teams.append(team_info)
+
+            # Build path -> team mapping
+            if normalized_pattern.endswith("/"):
+                dir_name = normalized_pattern.rstrip("/")
+                self.team_mapping[dir_name] = current_team
+            elif "*" in normalized_pattern:
+                prefix = normalized_pattern.rstrip("*")
+                if prefix:
+                    self.team_mapping[prefix] = current_team
+            else:
+                self.team_mapping[normalized_pattern] = current_team
+
     def _extract_owners_from_line(self, line: str) -> list[str]:
         """Extract owner references from a line."""
-        owners: list[str] = []
-
-        # Extract GitHub team mentions
-        for match in GITHUB_TEAM_PATTERN.finditer(line):
-            owner = match.group(0)
-            if owner not in owners:
-                owners.append(owner)
-
-        # Extract email patterns
-        for match in EMAIL_TEAM_PATTERN.finditer(line):
-            owner = match.group(1)
-            if owner not in owners:
-                owners.append(owner)
+        # Both owner forms contain "@"; most comment lines have neither.
+        if "@" not in line:
+            return []
 
-        return owners
+        # GitHub team mentions first, then emails, de-duplicated in order
+        owners = [match.group(0) for match in GITHUB_TEAM_PATTERN.finditer(line)]
+        owners.extend(EMAIL_TEAM_PATTERN.findall(line))
+        return list(dict.fromkeys(owners))
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for consistent display."""
@@ -188,23 +186,27 @@ class TeamFetcher:
     def get_team_for_path(self, chart_path: Path) -> str | None:
         """Get team name for a chart path."""
         chart_name = chart_path.name
+        team_mapping = self.team_mapping
 
         # Direct match first
-        if chart_name in self.team_mapping:
-            return self.team_mapping[chart_name]
-
-        # Try longest prefix match for nested directories
-        best_match: str | None = None
-        best_match_length = 0
-
-        for pattern, team in self.team_mapping.items():
-            if chart_name.startswith(pattern):
-                match_length = len(pattern)
-                if match_length > best_match_length:
-                    best_match = team
-                    best_match_length = match_length
-
-        return best_match
+        if chart_name in team_mapping:
+            return team_mapping[chart_name]
+
+        # Try longest prefix match for nested directories: probe one slice per
+        # distinct pattern length instead of scanning every pattern.
+        if self._prefix_lengths is None:
+            self._prefix_lengths = sorted(
+                {len(pattern) for pattern in team_mapping if pattern},
+                reverse=True,
+            )
+        name_length = len(chart_name)
+        for length in self._prefix_lengths:
+            if length < name_length:
+                team = team_mapping.get(chart_name[:length])
+                if team is not None:
+                    return team
+
+        return None
 
     def get_all_teams(self) -> list[str]:
         """Get list of all unique team names."""
@@ -15,6 +15,14 @@ from kubeagle.constants.patterns import (
 )
 from kubeagle.models.teams.team_info import TeamInfo
 
+# Parsed CODEOWNERS state per path, keyed on (st_mtime_ns, st_size). Screens
+# build a fresh ChartsController (and TeamMapper) per load, so unchanged files
+# are parsed once per process instead of once per controller.
+_CODEOWNERS_CACHE: dict[
+    str, tuple[tuple[int, int], tuple[TeamInfo, ...], dict[str, str]]
+] = {}
+_CODEOWNERS_CACHE_LOCK = threading.Lock()
+
 
 class TeamMapper:
     """Map chart directories to teams using CODEOWNERS file."""
@@ -74,10 +82,36 @@ class TeamMapper:
         self._parse_codeowners(codeowners_path)
 
     def _parse_codeowners(self, path: Path) -> None:
-        """Parse CODEOWNERS file to extract team mappings."""
-        if not path.exists():
+        """Parse CODEOWNERS file to extract team mappings.
+
+        Results are reused from ``_CODEOWNERS_CACHE`` while the file's
+        mtime and size are unchanged.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        cache_key = str(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with _CODEOWNERS_CACHE_LOCK:
+            cached = _CODEOWNERS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            # Copy so per-mapper registrations never leak into the cache.
+            self.teams = list(cached[1])
+            self.team_mapping = dict(cached[2])
             return
 
+        if not self._parse_codeowners_file(path):
+            return
+        with _CODEOWNERS_CACHE_LOCK:
+            _CODEOWNERS_CACHE[cache_key] = (
+                signature,
+                tuple(self.teams),
+                dict(self.team_mapping),
+            )
+
+    def _parse_codeowners_file(self, path: Path) -> bool:
+        """Parse CODEOWNERS file contents; return False if it could not be read."""
         try:
             with open(path, encoding="utf-8") as f:
                 current_team = "Unknown"
@@ -153,23 +187,21 @@ class TeamMapper:
                         self.team_mapping[normalized_pattern] = current_team
 
         except OSError:
-            return
+            return False
+        return True
 
     def _extract_owners_from_line(self, line: str) -> list[str]:
         """Extract owner references from a line."""
-        owners: list[str] = []
+        # Ordered de-duplication via dict keys instead of list scans.
+        owners: dict[str, None] = {}
 
         for match in GITHUB_TEAM_PATTERN.finditer(line):
-            owner = match.group(0)
-            if owner not in owners:
-                owners.append(owner)
+            owners[match.group(0)] = None
 
         for match in EMAIL_TEAM_PATTERN.finditer(line):
-            owner = match.group(1)
-            if owner not in owners:
-                owners.append(owner)
+            owners[match.group(1)] = None
 
-        return owners
+        return list(owners)
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name for consistent display.
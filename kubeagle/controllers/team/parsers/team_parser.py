@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 
@@ -23,10 +24,7 @@ class TeamParser:
         Returns:
             Dictionary mapping team name to list of charts.
         """
-        by_team: dict[str, list[dict[str, Any]]] = {}
+        by_team: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
         for chart in charts:
-            team = chart.get("team", "Unknown")
-            if team not in by_team:
-                by_team[team] = []
-            by_team[team].append(chart)
-        return by_team
+            by_team[chart.get("team", "Unknown")].append(chart)
+        return dict(by_team)
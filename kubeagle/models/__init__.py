@@ -1,45 +1,86 @@
 """KubEagle TUI Models.
 
-Public API exports for the models module.
+Public API exports for the models module. Exports are resolved lazily via
+module ``__getattr__`` so importing one model submodule does not build every
+Pydantic schema in the package.
 """
 
-from kubeagle.models.analysis.recommendation import (
-    ExtremeLimitRatio,
-    Recommendation,
-)
-from kubeagle.models.analysis.violation import ViolationResult
-from kubeagle.models.charts.active_charts import (
-    get_active_charts_set,
-    load_active_charts_from_file,
-)
-from kubeagle.models.charts.chart_info import ChartInfo
-from kubeagle.models.core.node_info import NodeInfo, NodeResourceInfo
-from kubeagle.models.core.workload_info import SingleReplicaWorkloadInfo
-from kubeagle.models.core.workload_inventory_info import WorkloadInventoryInfo
-from kubeagle.models.events.event_info import EventDetail, EventInfo
-from kubeagle.models.events.event_summary import EventSummary
-from kubeagle.models.optimization.optimization_rule import (
-    OptimizationRule,
-)
-from kubeagle.models.optimization.optimization_violation import (
-    OptimizationViolation,
-)
-from kubeagle.models.optimization.optimizer_controller import (
-    ContainerDict,
-    OptimizerController,
-    UnifiedOptimizerController,
-)
-from kubeagle.models.pdb.blocking_pdb import BlockingPDBInfo
-from kubeagle.models.pdb.pdb_info import PDBInfo
-from kubeagle.models.reports.report_data import ReportData
-from kubeagle.models.state.app_settings import AppSettings
-from kubeagle.models.state.app_state import AppState
-from kubeagle.models.state.config_manager import ConfigManager
-from kubeagle.models.teams.distribution import PodDistributionInfo
-from kubeagle.models.teams.team_info import TeamInfo
-from kubeagle.models.teams.team_statistics import TeamStatistics
-from kubeagle.models.types.columns import ColumnDef
-from kubeagle.models.types.loading import LoadingProgress, LoadResult
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kubeagle.models.analysis.recommendation import (
+        ExtremeLimitRatio,
+        Recommendation,
+    )
+    from kubeagle.models.analysis.violation import ViolationResult
+    from kubeagle.models.charts.active_charts import (
+        get_active_charts_set,
+        load_active_charts_from_file,
+    )
+    from kubeagle.models.charts.chart_info import ChartInfo
+    from kubeagle.models.core.node_info import NodeInfo, NodeResourceInfo
+    from kubeagle.models.core.workload_info import SingleReplicaWorkloadInfo
+    from kubeagle.models.core.workload_inventory_info import WorkloadInventoryInfo
+    from kubeagle.models.events.event_info import EventDetail, EventInfo
+    from kubeagle.models.events.event_summary import EventSummary
+    from kubeagle.models.optimization.optimization_rule import (
+        OptimizationRule,
+    )
+    from kubeagle.models.optimization.optimization_violation import (
+        OptimizationViolation,
+    )
+    from kubeagle.models.optimization.optimizer_controller import (
+        ContainerDict,
+        OptimizerController,
+        UnifiedOptimizerController,
+    )
+    from kubeagle.models.pdb.blocking_pdb import BlockingPDBInfo
+    from kubeagle.models.pdb.pdb_info import PDBInfo
+    from kubeagle.models.reports.report_data import ReportData
+    from kubeagle.models.state.app_settings import AppSettings
+    from kubeagle.models.state.app_state import AppState
+    from kubeagle.models.state.config_manager import ConfigManager
+    from kubeagle.models.teams.distribution import PodDistributionInfo
+    from kubeagle.models.teams.team_info import TeamInfo
+    from kubeagle.models.teams.team_statistics import TeamStatistics
+    from kubeagle.models.types.columns import ColumnDef
+    from kubeagle.models.types.loading import LoadingProgress, LoadResult
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "AppSettings": "kubeagle.models.state.app_settings",
+    "AppState": "kubeagle.models.state.app_state",
+    "BlockingPDBInfo": "kubeagle.models.pdb.blocking_pdb",
+    "ChartInfo": "kubeagle.models.charts.chart_info",
+    "ColumnDef": "kubeagle.models.types.columns",
+    "ConfigManager": "kubeagle.models.state.config_manager",
+    "ContainerDict": "kubeagle.models.optimization.optimizer_controller",
+    "EventDetail": "kubeagle.models.events.event_info",
+    "EventInfo": "kubeagle.models.events.event_info",
+    "EventSummary": "kubeagle.models.events.event_summary",
+    "ExtremeLimitRatio": "kubeagle.models.analysis.recommendation",
+    "LoadResult": "kubeagle.models.types.loading",
+    "LoadingProgress": "kubeagle.models.types.loading",
+    "NodeInfo": "kubeagle.models.core.node_info",
+    "NodeResourceInfo": "kubeagle.models.core.node_info",
+    "OptimizationRule": "kubeagle.models.optimization.optimization_rule",
+    "OptimizationViolation": "kubeagle.models.optimization.optimization_violation",
+    "OptimizerController": "kubeagle.models.optimization.optimizer_controller",
+    "PDBInfo": "kubeagle.models.pdb.pdb_info",
+    "PodDistributionInfo": "kubeagle.models.teams.distribution",
+    "Recommendation": "kubeagle.models.analysis.recommendation",
+    "ReportData": "kubeagle.models.reports.report_data",
+    "SingleReplicaWorkloadInfo": "kubeagle.models.core.workload_info",
+    "TeamInfo": "kubeagle.models.teams.team_info",
+    "TeamStatistics": "kubeagle.models.teams.team_statistics",
+    "UnifiedOptimizerController": "kubeagle.models.optimization.optimizer_controller",
+    "ViolationResult": "kubeagle.models.analysis.violation",
+    "WorkloadInventoryInfo": "kubeagle.models.core.workload_inventory_info",
+    "get_active_charts_set": "kubeagle.models.charts.active_charts",
+    "load_active_charts_from_file": "kubeagle.models.charts.active_charts",
+}
 
 __all__ = [
     "AppSettings",
@@ -73,3 +114,16 @@ __all__ = [
     "get_active_charts_set",
     "load_active_charts_from_file",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
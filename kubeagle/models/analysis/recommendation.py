@@ -1,6 +1,6 @@
 """Recommendation models."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 
 from kubeagle.constants.enums import Severity
 
@@ -34,5 +34,8 @@ class ExtremeLimitRatio(BaseModel):
     memory_limit: float  # bytes
     memory_ratio: float
 
-    # The maximum ratio (CPU or memory)
-    max_ratio: float
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def max_ratio(self) -> float:
+        """The maximum ratio (CPU or memory)."""
+        return max(self.cpu_ratio, self.memory_ratio)
@@ -1,6 +1,5 @@
 """Data cache implementation."""
 
-import asyncio
 import time
 from typing import Any
 
@@ -9,14 +8,16 @@ class DataCache:
     """TTL-based data caching with automatic invalidation and bounded size.
 
     Performance notes:
-    - Read operations (get, get_if_fresh) are lock-free. Since asyncio is
-      single-threaded and these methods perform only non-mutating dict reads,
-      no lock is needed. Expired entries are left in place (soft-expired) and
-      cleaned up lazily during set() eviction.
-    - Write operations (set, clear) acquire the lock to prevent interleaving
-      mutations from concurrent coroutines.
+    - All operations are lock-free. The cache is only used from the event
+      loop and no method awaits while touching the dict, so coroutines cannot
+      interleave inside a read or a mutation. The methods stay ``async`` for
+      API compatibility with existing callers.
+    - Expired entries are left in place (soft-expired) and cleaned up lazily
+      during set() eviction.
     """
 
+    __slots__ = ("_cache", "_max_entries")
+
     TTL_SECONDS = {
         "nodes": 300,
         "pods": 180,
@@ -28,8 +29,8 @@ class DataCache:
     MAX_ENTRIES = 256  # Generous limit to avoid premature eviction
 
     def __init__(self, max_entries: int | None = None) -> None:
-        self._cache: dict[str, dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        # key -> (data, monotonic timestamp, per-entry ttl or None)
+        self._cache: dict[str, tuple[Any, float, int | None]] = {}
         self._max_entries = max_entries or self.MAX_ENTRIES
 
     async def get(self, key: str) -> Any:
@@ -42,64 +43,36 @@ class DataCache:
         if entry is None:
             return None
 
-        ttl = self._get_ttl_info(key, entry)
-
-        if ttl is not None and self._is_expired(entry, ttl):
+        data, timestamp, ttl = entry
+        if time.monotonic() - timestamp > (ttl or self.TTL_SECONDS.get(key, 300)):
             return None
 
-        return entry["data"]
-
-    def _get_ttl_info(self, key: str, entry: dict[str, Any]) -> int | None:
-        """Get TTL value for a cache entry.
-
-        Args:
-            key: Cache key.
-            entry: Cache entry containing timestamp and optional ttl.
-
-        Returns:
-            TTL in seconds or None.
-        """
-        return entry.get("ttl") or self.TTL_SECONDS.get(key, 300)
-
-    def _is_expired(self, entry: dict[str, Any], ttl: int) -> bool:
-        """Check if a cache entry is expired.
-
-        Args:
-            entry: Cache entry with timestamp.
-            ttl: TTL in seconds.
-
-        Returns:
-            True if entry is expired.
-        """
-        age = time.monotonic() - entry["timestamp"]
-        return age > ttl
+        return data
 
     async def set(self, key: str, data: Any, ttl: int | None = None) -> None:
-        """Cache data with current timestamp (thread-safe)."""
-        async with self._lock:
-            self._cache[key] = {"data": data, "timestamp": time.monotonic(), "ttl": ttl}
-            if len(self._cache) > self._max_entries:
-                self._evict_expired_then_oldest()
+        """Cache data with current timestamp."""
+        self._cache[key] = (data, time.monotonic(), ttl)
+        if len(self._cache) > self._max_entries:
+            self._evict_expired_then_oldest()
 
     def _evict_expired_then_oldest(self) -> None:
-        """Evict expired entries first, then oldest by timestamp if still over limit.
-
-        Must be called under lock.
-        """
+        """Evict expired entries first, then oldest by timestamp if still over limit."""
         if not self._cache:
             return
 
         # Phase 1: Remove all expired entries
+        now = time.monotonic()
+        ttl_defaults = self.TTL_SECONDS
         expired_keys = [
-            k for k, entry in self._cache.items()
-            if self._is_expired(entry, self._get_ttl_info(k, entry) or 300)
+            k for k, (_, timestamp, ttl) in self._cache.items()
+            if now - timestamp > (ttl or ttl_defaults.get(k, 300))
         ]
         for k in expired_keys:
             del self._cache[k]
 
         # Phase 2: If still over limit, evict oldest by timestamp
         while len(self._cache) > self._max_entries:
-            oldest_key = min(self._cache, key=lambda k: self._cache[k]["timestamp"])
+            oldest_key = min(self._cache, key=lambda k: self._cache[k][1])
             del self._cache[oldest_key]
 
     async def get_if_fresh(self, key: str, max_age_seconds: float) -> Any:
@@ -120,15 +93,14 @@ class DataCache:
         entry = self._cache.get(key)
         if entry is None:
             return None
-        age = time.monotonic() - entry["timestamp"]
-        if age > max_age_seconds:
+        data, timestamp, _ = entry
+        if time.monotonic() - timestamp > max_age_seconds:
             return None
-        return entry["data"]
+        return data
 
     async def clear(self, key: str | None = None) -> None:
-        """Clear cache for specific key or all (thread-safe)."""
-        async with self._lock:
-            if key:
-                self._cache.pop(key, None)
-            else:
-                self._cache.clear()
+        """Clear cache for specific key or all."""
+        if key:
+            self._cache.pop(key, None)
+        else:
+            self._cache.clear()
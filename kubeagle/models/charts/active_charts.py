@@ -1,15 +1,17 @@
 """Active charts loading and caching utilities."""
 
 import logging
-from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_CHARTS_CACHE_MAX_ENTRIES = 128
+# path -> ((st_mtime_ns, st_size), parsed charts); edits on disk miss the cache.
+_active_charts_cache: dict[str, tuple[tuple[int, int], frozenset[str] | None]] = {}
+
 
-@lru_cache(maxsize=128)
 def _load_active_charts_cached(file_path: str) -> frozenset[str] | None:
-    """Cached loader that uses string path for hashability.
+    """Cached loader keyed by path and validated against the file's mtime/size.
 
     Args:
         file_path: String path to the active charts file.
@@ -19,17 +21,34 @@ def _load_active_charts_cached(file_path: str) -> frozenset[str] | None:
     """
     path = Path(file_path)
     try:
-        if not path.exists():
-            return None
-        with path.open("r", encoding="utf-8") as f:
-            charts = frozenset(
-                s for line in f if (s := line.strip()) and not s.startswith("#")
-            )
-        return charts or None
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error("Failed to load active charts from %s: %s", file_path, e)
         return None
 
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _active_charts_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        # Decode the whole file once; splitlines and strip run in C.
+        lines = path.read_text(encoding="utf-8").splitlines()
+        charts = frozenset(s for s in map(str.strip, lines) if s and s[0] != "#")
+    except Exception as e:
+        logger.error("Failed to load active charts from %s: %s", file_path, e)
+        return None
+
+    result = charts or None
+    _active_charts_cache.pop(file_path, None)
+    if len(_active_charts_cache) >= _ACTIVE_CHARTS_CACHE_MAX_ENTRIES:
+        # Evict the oldest inserted path.
+        del _active_charts_cache[next(iter(_active_charts_cache))]
+    _active_charts_cache[file_path] = (signature, result)
+    return result
+
 
 def load_active_charts_from_file(file_path: Path) -> frozenset[str] | None:
     """Load active chart names from a file (one chart name per line).
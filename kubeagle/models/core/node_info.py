@@ -1,6 +1,6 @@
 """Node information models."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from kubeagle.constants.enums import NodeStatus
 
@@ -26,8 +26,8 @@ class NodeInfo(BaseModel):
     memory_usage: float = 0.0  # In bytes
     # Extended fields for controller methods
     kubelet_version: str = ""
-    conditions: dict[str, str] = {}
-    taints: list[dict[str, str]] = []
+    conditions: dict[str, str] = Field(default_factory=dict)
+    taints: list[dict[str, str]] = Field(default_factory=list)
 
 
 class NodeResourceInfo(BaseModel):
@@ -1,14 +1,13 @@
 """Optimization rule models."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from kubeagle.models.optimization.optimization_rule import OptimizationRule
 from kubeagle.models.optimization.optimization_violation import (
     OptimizationViolation,
 )
-from kubeagle.models.optimization.optimizer_controller import (
-    ContainerDict,
-    OptimizerController,
-    UnifiedOptimizerController,
-)
 from kubeagle.models.optimization.resource_impact import (
     ChartResourceSnapshot,
     ClusterNodeGroup,
@@ -19,6 +18,19 @@ from kubeagle.models.optimization.resource_impact import (
     ResourceImpactResult,
 )
 
+if TYPE_CHECKING:
+    from kubeagle.models.optimization.optimizer_controller import (
+        ContainerDict,
+        OptimizerController,
+        UnifiedOptimizerController,
+    )
+
+# The controller imports kubeagle.optimizer, whose rules module imports this
+# package; resolve its exports lazily so either side can be imported first.
+_CONTROLLER_EXPORTS = frozenset(
+    {"ContainerDict", "OptimizerController", "UnifiedOptimizerController"}
+)
+
 __all__ = [
     "ChartResourceSnapshot",
     "ClusterNodeGroup",
@@ -33,3 +45,11 @@ __all__ = [
     "ResourceImpactResult",
     "UnifiedOptimizerController",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CONTROLLER_EXPORTS:
+        from kubeagle.models.optimization import optimizer_controller
+
+        return getattr(optimizer_controller, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
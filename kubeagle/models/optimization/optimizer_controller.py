@@ -8,6 +8,7 @@ Moved from: controllers/optimizer_controller.py
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 import shutil
@@ -16,7 +17,8 @@ from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, TypedDict
 
-from pydantic import BaseModel, PrivateAttr
+import yaml
+from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import NotRequired
 
 from kubeagle.constants.enums import Severity
@@ -32,10 +34,16 @@ from kubeagle.optimizer.rules import (
     OptimizationViolation as RuleViolation,
     get_rule_by_id,
 )
-from kubeagle.utils.resource_parser import memory_str_to_bytes, parse_cpu
+from kubeagle.utils.resource_parser import (
+    memory_str_to_bytes_cached,
+    parse_cpu_millicores_cached,
+)
 
 logger = logging.getLogger(__name__)
 
+# One tuple snapshot of the registered rules, shared by every controller.
+_DEFAULT_RULES = tuple(RULES)
+
 
 class ContainerDict(TypedDict):
     """Type definition for container dict used by optimizer rules.
@@ -60,15 +68,24 @@ class UnifiedOptimizerController(BaseModel):
     optimization rules and generates violation reports with fix suggestions.
 
     Attributes:
-        rules: List of optimization rules to check against.
+        rules: Tuple of optimization rules to check against.
     """
 
-    rules: list = RULES
+    # A plain ``RULES`` default would be deep-copied by Pydantic on every
+    # construction; the factory hands out the shared module-level snapshot.
+    rules: tuple = Field(default_factory=lambda: _DEFAULT_RULES)
     analysis_source: str = "auto"  # auto|rendered|values
     render_timeout_seconds: int = 30
     max_workers: int = 0
     _helm_available: bool | None = PrivateAttr(default=None)
     _helm_unavailable_logged: bool = PrivateAttr(default=False)
+    # (values path, release name, render timeout) -> (chart tree signature,
+    # rule inputs built from the render). Umbrella sub-charts share the parent
+    # values file but render under their own release name.
+    _rendered_cache: dict[
+        tuple[str, str, int],
+        tuple[tuple[int, int], list[dict[str, Any]]],
+    ] = PrivateAttr(default_factory=dict)
 
     @staticmethod
     def _format_cpu_millicores(cpu_millicores: float) -> str:
@@ -103,12 +120,14 @@ class UnifiedOptimizerController(BaseModel):
         Returns:
             Dictionary representation suitable for rule checking.
         """
+        requests: dict[str, str] = {}
+        limits: dict[str, str] = {}
         chart_dict: dict[str, Any] = {
             "chart_name": chart.name,
             "qos_class": chart.qos_class.value,
             "resources": {
-                "requests": {},
-                "limits": {},
+                "requests": requests,
+                "limits": limits,
             },
             "containers": [],
             "topologySpreadConstraints": [],
@@ -117,39 +136,36 @@ class UnifiedOptimizerController(BaseModel):
 
         # Add resources
         if chart.cpu_request > 0:
-            chart_dict["resources"]["requests"]["cpu"] = self._format_cpu_millicores(
-                chart.cpu_request
-            )
+            requests["cpu"] = self._format_cpu_millicores(chart.cpu_request)
         if chart.memory_request > 0:
-            chart_dict["resources"]["requests"]["memory"] = (
-                self._format_memory_mib_from_bytes(chart.memory_request)
-            )
+            requests["memory"] = self._format_memory_mib_from_bytes(chart.memory_request)
         if chart.cpu_limit > 0:
-            chart_dict["resources"]["limits"]["cpu"] = self._format_cpu_millicores(
-                chart.cpu_limit
-            )
+            limits["cpu"] = self._format_cpu_millicores(chart.cpu_limit)
         if chart.memory_limit > 0:
-            chart_dict["resources"]["limits"]["memory"] = (
-                self._format_memory_mib_from_bytes(chart.memory_limit)
-            )
+            limits["memory"] = self._format_memory_mib_from_bytes(chart.memory_limit)
 
         # Add probe flags at root level for rule detection (#8)
-        if chart.has_liveness:
+        has_liveness = chart.has_liveness
+        has_readiness = chart.has_readiness
+        has_startup = chart.has_startup
+        if has_liveness:
             chart_dict["livenessProbe"] = {}
-        if chart.has_readiness:
+        if has_readiness:
             chart_dict["readinessProbe"] = {}
-        if chart.has_startup:
+        if has_startup:
             chart_dict["startupProbe"] = {}
 
-        # Add container probes (kept for FixGenerator compatibility)
-        container: ContainerDict = {"name": chart.name}
-        if chart.has_liveness:
-            container["livenessProbe"] = {}
-        if chart.has_readiness:
-            container["readinessProbe"] = {}
-        if chart.has_startup:
-            container["startupProbe"] = {}
-        chart_dict["containers"] = [container] if container else []
+        # Add container probes (kept for FixGenerator compatibility); charts
+        # without probes keep the empty containers list from the literal above.
+        if has_liveness or has_readiness or has_startup:
+            container: ContainerDict = {"name": chart.name}
+            if has_liveness:
+                container["livenessProbe"] = {}
+            if has_readiness:
+                container["readinessProbe"] = {}
+            if has_startup:
+                container["startupProbe"] = {}
+            chart_dict["containers"] = [container]
 
         # Add topology spread
         if chart.has_topology_spread:
@@ -448,21 +464,81 @@ class UnifiedOptimizerController(BaseModel):
         self._helm_available = shutil.which("helm") is not None
         return self._helm_available
 
-    def _check_chart_rendered(self, chart: ChartInfo) -> list[ViolationResult] | None:
-        """Run optimizer checks on rendered manifests.
+    @staticmethod
+    def _local_dependency_dirs(chart_dir: Path) -> list[Path]:
+        """Return directories of ``file://`` dependencies declared in Chart.yaml.
 
-        Returns None when rendered analysis is unavailable so caller can fallback.
+        Only direct dependencies are resolved; ``file://`` dependencies of
+        those dependencies are not followed.
         """
-        values_file = str(chart.values_file or "")
-        if not values_file or values_file.startswith("cluster:"):
-            return None
+        try:
+            with open(chart_dir / "Chart.yaml", encoding="utf-8") as fh:
+                content = yaml.safe_load(fh)
+        except (OSError, yaml.YAMLError):
+            return []
+        if not isinstance(content, dict):
+            return []
+        dependencies = content.get("dependencies")
+        if not isinstance(dependencies, list):
+            return []
 
-        values_path = Path(values_file).expanduser().resolve()
-        if not values_path.exists():
-            return None
-        chart_dir = values_path.parent
-        if not (chart_dir / "Chart.yaml").exists():
+        dirs: list[Path] = []
+        for dep in dependencies:
+            if not isinstance(dep, dict):
+                continue
+            repository = dep.get("repository")
+            if not isinstance(repository, str) or not repository.startswith("file://"):
+                continue
+            relative = repository.removeprefix("file://").rstrip("/")
+            dirs.append((chart_dir / relative).resolve())
+        return dirs
+
+    @classmethod
+    def _chart_tree_signature(cls, chart_dir: Path) -> tuple[int, int] | None:
+        """Return (newest mtime_ns, file count) over the chart's source files.
+
+        Covers every file under chart_dir plus the trees of its direct
+        ``file://`` dependencies, which may live outside chart_dir. Any
+        template, values or dependency edit bumps the newest mtime, and added
+        or removed files change the count. Returns None when a file cannot be
+        stat'ed.
+        """
+        newest = 0
+        file_count = 0
+        roots = dict.fromkeys([chart_dir, *cls._local_dependency_dirs(chart_dir)])
+        try:
+            for tree in roots:
+                for root, _dirs, files in os.walk(tree):
+                    for name in files:
+                        mtime_ns = os.stat(os.path.join(root, name)).st_mtime_ns
+                        if mtime_ns > newest:
+                            newest = mtime_ns
+                        file_count += 1
+        except OSError:
             return None
+        return newest, file_count
+
+    def invalidate_rendered_cache(self) -> None:
+        """Drop cached rendered rule inputs, forcing the next check to re-render."""
+        self._rendered_cache.clear()
+
+    def _rendered_rule_inputs(
+        self,
+        chart: ChartInfo,
+        chart_dir: Path,
+        values_path: Path,
+    ) -> list[dict[str, Any]] | None:
+        """Render the chart into rule inputs, reusing them while the chart is unchanged.
+
+        Callers always receive their own copy, so rule checks that mutate the
+        inputs cannot leak into later checks or other worker threads.
+        """
+        cache_key = (str(values_path), chart.name, self.render_timeout_seconds)
+        signature = self._chart_tree_signature(chart_dir)
+        if signature is not None:
+            cached = self._rendered_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return copy.deepcopy(cached[1])
 
         render_result = render_chart(
             chart_dir=chart_dir,
@@ -477,6 +553,29 @@ class UnifiedOptimizerController(BaseModel):
             render_result.docs,
             chart_name=chart.name,
         )
+        if signature is not None:
+            self._rendered_cache[cache_key] = (signature, copy.deepcopy(rule_inputs))
+        return rule_inputs
+
+    def _check_chart_rendered(self, chart: ChartInfo) -> list[ViolationResult] | None:
+        """Run optimizer checks on rendered manifests.
+
+        Returns None when rendered analysis is unavailable so caller can fallback.
+        """
+        values_file = str(chart.values_file or "")
+        if not values_file or values_file.startswith("cluster:"):
+            return None
+
+        values_path = Path(values_file).expanduser().resolve()
+        if not values_path.exists():
+            return None
+        chart_dir = values_path.parent
+        if not (chart_dir / "Chart.yaml").exists():
+            return None
+
+        rule_inputs = self._rendered_rule_inputs(chart, chart_dir, values_path)
+        if rule_inputs is None:
+            return None
         if not rule_inputs:
             return []
 
@@ -561,10 +660,10 @@ class UnifiedOptimizerController(BaseModel):
         )
         if cpu_value is None:
             return None
-        cores = parse_cpu(cpu_value)
-        if cores <= 0:
+        millicores = parse_cpu_millicores_cached(cpu_value)
+        if millicores <= 0:
             return None
-        return cores * 1000
+        return millicores
 
     @classmethod
     def _rendered_memory_bytes(
@@ -580,7 +679,7 @@ class UnifiedOptimizerController(BaseModel):
         )
         if memory_value is None:
             return None
-        bytes_value = memory_str_to_bytes(memory_value)
+        bytes_value = memory_str_to_bytes_cached(memory_value)
         if bytes_value <= 0:
             return None
         return bytes_value
@@ -1011,7 +1011,7 @@ class ReportExportScreen(MainNavigationTabsMixin, ScreenNavigator, WorkerMixin,
 
         try:
             # Run file I/O in thread pool to avoid blocking UI
-            await asyncio.to_thread(save_path.write_text, report)
+            await asyncio.to_thread(save_path.write_text, report, encoding="utf-8")
             self._update_export_status(f"Saved to {save_path}", is_success=True)
             self.notify(f"Report saved to {save_path}", severity="information")
         except Exception as e:
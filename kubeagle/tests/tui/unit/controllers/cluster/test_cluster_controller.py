@@ -57,6 +57,26 @@ class TestClusterController:
         controller = ClusterController()
         assert controller.context is None
 
+    def test_fetchers_share_decoded_items_cache(
+        self, controller: ClusterController
+    ) -> None:
+        """Fetchers decoding kubectl JSON should share one items cache."""
+        shared = controller._decoded_items_cache
+        assert controller._node_fetcher._items_cache is shared
+        assert controller._pod_fetcher._items_cache is shared
+        assert controller._event_fetcher._items_cache is shared
+        assert controller._cluster_fetcher._items_cache is shared
+
+    def test_clear_global_command_cache_clears_decoded_items(
+        self, controller: ClusterController
+    ) -> None:
+        """Global refresh should also drop decoded kubectl items."""
+        controller._decoded_items_cache.decode_items(("get", "pods"), '{"items": []}')
+
+        ClusterController.clear_global_command_cache(context="my-cluster")
+
+        assert not controller._decoded_items_cache._entries
+
     def test_initialize_fetch_states(self, controller: ClusterController) -> None:
         """Test _initialize_fetch_states creates all sources."""
         sources = list(controller._fetch_states.keys())
@@ -421,6 +441,39 @@ class TestClusterController:
         fetch_pods_mock.assert_not_awaited()
         ClusterController.reset_semaphore()
 
+    @pytest.mark.asyncio
+    async def test_node_and_node_resource_fetches_share_one_node_query(
+        self,
+        controller: ClusterController,
+    ) -> None:
+        """Concurrent node fetches should coalesce into one projected kubectl call."""
+        ClusterController.reset_semaphore()
+        ClusterController.clear_global_command_cache()
+        node_calls: list[tuple[str, ...]] = []
+
+        async def _run_kubectl(args: tuple[str, ...]) -> str:
+            if args[:2] == ("get", "nodes"):
+                node_calls.append(args)
+                await asyncio.sleep(0)
+                return 'node-a\t{}\t{"cpu":"2"}\t[]\tv1.30.0\t\t\n'
+            return ""
+
+        controller._run_kubectl_uncached = _run_kubectl  # type: ignore[method-assign]
+        controller._pods_cache = [{"spec": {"nodeName": "node-a"}}]
+        controller._top_metrics_fetcher.fetch_top_nodes = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+        nodes, resources = await asyncio.gather(
+            controller.fetch_nodes(),
+            controller.fetch_node_resources(),
+        )
+
+        assert [node.name for node in nodes] == ["node-a"]
+        assert [resource.name for resource in resources] == ["node-a"]
+        assert len(node_calls) == 1
+        assert any(part.startswith("jsonpath=") for part in node_calls[0])
+        ClusterController.clear_global_command_cache()
+        ClusterController.reset_semaphore()
+
     @pytest.mark.asyncio
     async def test_fetch_node_resources_populates_limits_and_pod_count(
         self,
@@ -428,7 +481,7 @@ class TestClusterController:
     ) -> None:
         """fetch_node_resources should carry through limit and pod metrics."""
         ClusterController.reset_semaphore()
-        controller._node_fetcher.fetch_nodes_raw = AsyncMock(  # type: ignore[method-assign]
+        controller._node_fetcher.fetch_node_items = AsyncMock(  # type: ignore[method-assign]
             return_value=[
                 {
                     "metadata": {
@@ -826,6 +879,54 @@ class TestClusterController:
         assert {entry[2] for entry in callbacks} == {1, 2}
         assert all(entry[3] == 2 for entry in callbacks)
 
+    @pytest.mark.asyncio
+    async def test_fetch_helm_releases_incremental_batches_without_callback(
+        self,
+        controller: ClusterController,
+    ) -> None:
+        """Without a callback, releases should come from one cluster-wide list."""
+        controller._list_cluster_namespaces = AsyncMock(  # type: ignore[method-assign]
+            return_value=["ns-a", "ns-b"]
+        )
+        release = HelmReleaseInfo(
+            name="rel",
+            namespace="ns-a",
+            chart="app-1.0.0",
+            version="1",
+            app_version="1.0.0",
+            status="deployed",
+        )
+        controller._cluster_fetcher.fetch_helm_releases = AsyncMock(  # type: ignore[method-assign]
+            return_value=[release]
+        )
+        per_namespace = AsyncMock(return_value=[])
+        controller._cluster_fetcher.fetch_helm_releases_for_namespace = per_namespace  # type: ignore[method-assign]
+
+        releases = await controller._fetch_helm_releases_incremental()
+
+        assert releases == [release]
+        per_namespace.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fetch_helm_releases_incremental_falls_back_when_batch_empty(
+        self,
+        controller: ClusterController,
+    ) -> None:
+        """An empty cluster-wide list should fall back to per-namespace calls."""
+        controller._list_cluster_namespaces = AsyncMock(  # type: ignore[method-assign]
+            return_value=["ns-a", "ns-b"]
+        )
+        controller._cluster_fetcher.fetch_helm_releases = AsyncMock(  # type: ignore[method-assign]
+            return_value=[]
+        )
+        per_namespace = AsyncMock(return_value=[])
+        controller._cluster_fetcher.fetch_helm_releases_for_namespace = per_namespace  # type: ignore[method-assign]
+
+        releases = await controller._fetch_helm_releases_incremental()
+
+        assert releases == []
+        assert per_namespace.await_count == 2
+
     @pytest.mark.asyncio
     async def test_fetch_single_replica_incremental_streams_namespace_callbacks(
         self,
@@ -1822,7 +1923,7 @@ class TestClusterController:
         controller._pod_fetcher.fetch_pods = AsyncMock(  # type: ignore[method-assign]
             side_effect=_slow_incremental
         )
-        controller._node_fetcher.fetch_nodes_raw = AsyncMock(  # type: ignore[method-assign]
+        controller._node_fetcher.fetch_node_items = AsyncMock(  # type: ignore[method-assign]
             return_value=[
                 {
                     "metadata": {
@@ -2113,7 +2214,7 @@ class TestClusterController:
         )
 
         controller._pod_fetcher.fetch_pods = AsyncMock(return_value=[])  # type: ignore[method-assign]
-        controller._node_fetcher.fetch_nodes_raw = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        controller._node_fetcher.fetch_node_items = AsyncMock(return_value=[])  # type: ignore[method-assign]
         controller._top_metrics_fetcher.fetch_top_nodes = AsyncMock(  # type: ignore[method-assign]
             side_effect=RuntimeError("top node unavailable")
         )
@@ -97,6 +97,7 @@ class TestClusterFetcher:
         assert result[0].chart == "frontend-1.0.0"
         called_args = mock_run_helm.await_args_list[0].args[0]
         assert "--timeout" not in called_args
+        assert called_args[called_args.index("--max") + 1] == "0"
 
     @pytest.mark.asyncio
     async def test_fetch_helm_releases_no_helm(self, mock_run_kubectl: AsyncMock) -> None:
@@ -0,0 +1,71 @@
+"""Tests for decoded kubectl output cache."""
+
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from kubeagle.controllers.cluster.fetchers.decode_cache import DecodedItemsCache
+
+
+class TestDecodedItemsCache:
+    """Tests for DecodedItemsCache class."""
+
+    def test_reuses_items_for_identical_output_object(self) -> None:
+        """Same output object for the same command should skip re-decoding."""
+        cache = DecodedItemsCache()
+        output = '{"items": [{"metadata": {"name": "pod-a"}}]}'
+
+        first = cache.decode_items(("get", "pods"), output)
+        second = cache.decode_items(("get", "pods"), output)
+
+        assert first == second
+        assert first is not second
+        assert first[0] is second[0]
+
+    def test_decodes_again_for_new_output(self) -> None:
+        """A fresh output string should be decoded instead of served from cache."""
+        cache = DecodedItemsCache()
+        cache.decode_items(("get", "pods"), '{"items": [{"name": "old"}]}')
+
+        items = cache.decode_items(("get", "pods"), '{"items": [{"name": "new"}]}')
+
+        assert items == [{"name": "new"}]
+
+    def test_evicts_least_recently_used_entries(self) -> None:
+        """Cache should stay within max_entries."""
+        cache = DecodedItemsCache(max_entries=1)
+        output = '{"items": []}'
+        cache.decode_items(("a",), output)
+        cache.decode_items(("b",), output)
+
+        assert list(cache._entries) == [("b",)]
+
+    def test_invalid_json_raises(self) -> None:
+        """Invalid payloads should raise the orjson decode error."""
+        cache = DecodedItemsCache()
+
+        with pytest.raises(orjson.JSONDecodeError):
+            cache.decode_items(("get", "pods"), "not json")
+
+    def test_expires_entries_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries older than the TTL should be decoded again and pruned."""
+        now = [100.0]
+        monkeypatch.setattr(
+            "kubeagle.controllers.cluster.fetchers.decode_cache.time.monotonic",
+            lambda: now[0],
+        )
+        cache = DecodedItemsCache(ttl_seconds=10.0)
+        output = '{"items": [{"name": "a"}]}'
+        first = cache.decode_items(("get", "pods"), output)
+
+        now[0] += 11.0
+        second = cache.decode_items(("get", "pods"), output)
+
+        assert second == first
+        assert second[0] is not first[0]
+
+        now[0] += 11.0
+        cache.decode_items(("get", "nodes"), '{"items": []}')
+
+        assert list(cache._entries) == [("get", "nodes")]
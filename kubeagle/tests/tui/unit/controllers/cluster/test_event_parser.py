@@ -144,6 +144,41 @@ class TestEventParser:
         assert parser._is_eviction_event("Scheduled", "pod scheduled") is False
         assert parser._is_eviction_event("Created", "pod created") is False
 
+    def test_classify_event_follows_check_precedence(self, parser: EventParser) -> None:
+        """Test _classify_event applies message keywords before later reason buckets."""
+        assert parser._classify_event("FailedScheduling", "OOMKill", "Pod") == "oom_count"
+        assert parser._classify_event("NodeNotReady", "node down", "Node") == "node_not_ready_count"
+        assert parser._classify_event("NodeNotReady", "node down", "Pod") is None
+        assert parser._classify_event("FailedMount", "BackOff mounting", "Pod") == "backoff_count"
+        assert parser._classify_event("Failed", "Failed to pull image", "Pod") == "backoff_count"
+        assert parser._classify_event("Unhealthy", "probe failed", "Pod") == "unhealthy_count"
+        assert parser._classify_event("Killing", "pod evicted", "Pod") == "evicted_count"
+        assert parser._classify_event("Scheduled", "pod scheduled", "Pod") is None
+        # A "Failed" reason bucket would let it skip the image-pull probe.
+        assert "Failed" not in parser._REASON_BUCKETS
+        assert parser._classify_event("Unhealthy", "Failed to pull", "Pod") == "unhealthy_count"
+
+    def test_parse_events_summary_tolerates_null_nested_objects(
+        self, parser: EventParser
+    ) -> None:
+        """Test explicit null series/metadata/involvedObject values are skipped."""
+        now = datetime.now(timezone.utc)
+        events = [
+            {
+                "reason": "BackOff",
+                "message": "Back-off restarting failed container",
+                "type": "Warning",
+                "series": None,
+                "metadata": None,
+                "involvedObject": None,
+                "lastTimestamp": now.isoformat(),
+            }
+        ]
+
+        result = parser.parse_events_summary(events)
+
+        assert result.backoff_count == 1
+
     def test_parse_events_summary_empty(self, parser: EventParser) -> None:
         """Test parse_events_summary with empty events list."""
         result = parser.parse_events_summary([])
@@ -350,3 +385,27 @@ class TestEventParser:
         result = parser.parse_events_summary(events, max_recent_events=3)
 
         assert len(result.recent_events) == 3
+
+    def test_parse_events_summary_keeps_newest_recent_events(self, parser: EventParser) -> None:
+        """Test recent events are the newest ones, ties kept in input order."""
+        now = datetime.now(timezone.utc)
+        ages = [50, 10, 30, 10, 40]
+        events = [
+            {
+                "reason": f"Reason{i}",
+                "message": "probe failed",
+                "type": "Warning",
+                "count": 1,
+                "lastTimestamp": (now - timedelta(seconds=age)).isoformat(),
+                "involvedObject": {"name": f"pod{i}", "kind": "Pod"},
+            }
+            for i, age in enumerate(ages)
+        ]
+
+        result = parser.parse_events_summary(events, max_recent_events=3)
+
+        assert [e["reason"] for e in result.recent_events] == [
+            "Reason1",
+            "Reason3",
+            "Reason2",
+        ]
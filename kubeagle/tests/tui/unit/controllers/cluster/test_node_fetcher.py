@@ -83,3 +83,114 @@ class TestNodeFetcher:
 
         assert len(nodes) == 1
         assert nodes[0].name == "node-a"
+
+    @pytest.mark.asyncio
+    async def test_fetch_nodes_parses_projected_summary(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        """fetch_nodes should build NodeInfo objects from the jsonpath projection."""
+        mock_run_kubectl.return_value = (
+            "node-a\t"
+            '{"eks.amazonaws.com/nodegroup":"workers"}\t'
+            '{"cpu":"2","memory":"8Gi","pods":"58"}\t'
+            '[{"type":"Ready","status":"True"}]\t'
+            "v1.30.0\t"
+            "\t"
+            "true\n"
+        )
+        fetcher = NodeFetcher(mock_run_kubectl)
+
+        nodes = await fetcher.fetch_nodes()
+
+        assert mock_run_kubectl.await_count == 1
+        args = mock_run_kubectl.await_args_list[0].args[0]
+        assert any(part.startswith("jsonpath=") for part in args)
+        assert len(nodes) == 1
+        assert nodes[0].name == "node-a"
+        assert nodes[0].node_group == "workers"
+        assert nodes[0].pod_capacity == 58
+        assert nodes[0].kubelet_version == "v1.30.0"
+        assert nodes[0].taints == []
+
+    @pytest.mark.asyncio
+    async def test_fetch_node_items_keeps_node_layout(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        """Projected items should match the full node layout and defaults."""
+        mock_run_kubectl.return_value = (
+            '\t{}\t{"cpu":"2"}\t[]\t\t[{"key":"dedicated"}]\ttrue\n'
+        )
+        fetcher = NodeFetcher(mock_run_kubectl)
+
+        items = await fetcher.fetch_node_items()
+        nodes = await fetcher.fetch_nodes()
+
+        assert items == [
+            {
+                "metadata": {"labels": {}},
+                "status": {"allocatable": {"cpu": "2"}, "conditions": []},
+                "spec": {"taints": [{"key": "dedicated"}], "unschedulable": True},
+            }
+        ]
+        assert nodes[0].name == "Unknown"
+        assert nodes[0].kubelet_version == ""
+
+    @pytest.mark.asyncio
+    async def test_fetch_nodes_retries_projection_on_timeout(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        """A timed-out projection should be retried, not replaced by the full list."""
+        mock_run_kubectl.side_effect = [
+            RuntimeError("request timed out"),
+            'node-a\t{}\t{}\t[]\tv1.30.0\t\t\n',
+        ]
+        fetcher = NodeFetcher(mock_run_kubectl)
+
+        nodes = await fetcher.fetch_nodes()
+
+        assert [node.name for node in nodes] == ["node-a"]
+        assert mock_run_kubectl.await_count == 2
+        for call in mock_run_kubectl.await_args_list:
+            assert any(part.startswith("jsonpath=") for part in call.args[0])
+        assert "--request-timeout=45s" in mock_run_kubectl.await_args_list[1].args[0]
+
+    @pytest.mark.asyncio
+    async def test_fetch_nodes_parse_errors_do_not_refetch(
+        self,
+        mock_run_kubectl: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Errors while building NodeInfo should not trigger the full-list fallback."""
+        mock_run_kubectl.return_value = 'node-a\t{}\t{}\t[]\tv1.30.0\t\t\n'
+        fetcher = NodeFetcher(mock_run_kubectl)
+
+        def _raise(*_args: object) -> None:
+            raise ValueError("bad quantity")
+
+        monkeypatch.setattr(NodeFetcher, "_build_node_info", staticmethod(_raise))
+
+        with pytest.raises(ValueError, match="bad quantity"):
+            await fetcher.fetch_nodes()
+
+        assert mock_run_kubectl.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_nodes_falls_back_when_projection_unparseable(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        """fetch_nodes should use the full node list when projection output is not JSON."""
+        mock_run_kubectl.side_effect = [
+            "node-a\tmap[]\tmap[]\t[]\tv1.30.0\t\t\n",
+            '{"items": [{"metadata": {"name": "node-a"}}]}',
+        ]
+        fetcher = NodeFetcher(mock_run_kubectl)
+
+        nodes = await fetcher.fetch_nodes()
+
+        assert mock_run_kubectl.await_count == 2
+        assert "json" in mock_run_kubectl.await_args_list[1].args[0]
+        assert [node.name for node in nodes] == ["node-a"]
@@ -158,6 +158,18 @@ class TestPodParser:
         assert result["cpu_stats"]["min"] == 0
         assert result["memory_stats"]["min"] == 0
 
+    def test_calc_stats_uses_lower_p95_index(self) -> None:
+        """Test _calc_stats picks min/max/p95 from one sorted pass."""
+        stats = PodParser._calc_stats([float(v) for v in range(20, 0, -1)])
+
+        assert stats == {"min": 1.0, "avg": 10.5, "max": 20.0, "p95": 20.0}
+        assert PodParser._calc_stats([]) == {
+            "min": 0,
+            "avg": 0.0,
+            "max": 0,
+            "p95": 0,
+        }
+
     def test_parse_distribution_empty(self, parser: PodParser) -> None:
         """Test parse_distribution with empty nodes and pods."""
         nodes: list[dict] = []
@@ -260,3 +272,16 @@ class TestPodParser:
         # Total pods from parse_pods_by_node includes both, but distribution
         # only iterates known nodes
         assert result.total_pods == 1  # Only pods on known nodes counted
+
+    def test_get_label_value_returns_default_for_missing_labels(
+        self, parser: PodParser
+    ) -> None:
+        """Test _get_label_value short-circuits on empty or null labels."""
+        labels = PodParser._NODE_GROUP_LABELS
+
+        assert parser._get_label_value({}, labels) == "Unknown"
+        assert parser._get_label_value(None, labels) == "Unknown"  # type: ignore[arg-type]
+        assert (
+            parser._get_label_value({"karpenter.sh/nodepool": "np-a"}, labels)
+            == "np-a"
+        )
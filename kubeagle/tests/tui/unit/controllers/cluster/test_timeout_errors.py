@@ -0,0 +1,28 @@
+"""Tests for cluster fetcher timeout error detection."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+
+from kubeagle.controllers.cluster.fetchers.timeout_errors import is_timeout_error
+
+
+class TestIsTimeoutError:
+    """Tests for is_timeout_error function."""
+
+    def test_typed_timeout_exceptions(self) -> None:
+        """Typed timeout exceptions should match without message inspection."""
+        assert is_timeout_error(TimeoutError()) is True
+        assert is_timeout_error(asyncio.TimeoutError()) is True
+        assert is_timeout_error(subprocess.TimeoutExpired(["kubectl"], 10)) is True
+
+    def test_kubectl_timeout_messages(self) -> None:
+        """Runtime errors carrying kubectl timeout wording should match."""
+        assert is_timeout_error(RuntimeError("context deadline exceeded")) is True
+        assert is_timeout_error(RuntimeError("request Timed Out")) is True
+
+    def test_non_timeout_errors(self) -> None:
+        """Other failures should not be treated as timeouts."""
+        assert is_timeout_error(RuntimeError("forbidden")) is False
+        assert is_timeout_error(OSError("no such file")) is False
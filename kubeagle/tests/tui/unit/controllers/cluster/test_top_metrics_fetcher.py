@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -22,6 +24,12 @@ class TestTopMetricsFetcher:
         fetcher = TopMetricsFetcher(mock_run_kubectl)
         assert fetcher._run_kubectl is mock_run_kubectl
 
+    def test_clean_names_strips_and_dedupes_in_order(self) -> None:
+        names = TopMetricsFetcher._clean_names(
+            [" node-b", "node-a", "", "node-b ", None, "  ", "node-c"]  # type: ignore[list-item]
+        )
+        assert names == ["node-b", "node-a", "node-c"]
+
     @pytest.mark.asyncio
     async def test_fetch_top_nodes_parses_output(self, mock_run_kubectl: AsyncMock) -> None:
         mock_run_kubectl.return_value = "\n".join(
@@ -81,6 +89,28 @@ class TestTopMetricsFetcher:
         assert len(rows) == 1
         assert rows[0]["node_name"] == "node-a"
 
+    @pytest.mark.asyncio
+    async def test_fetch_top_pods_parses_large_output_in_thread(
+        self,
+        mock_run_kubectl: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        mock_run_kubectl.return_value = "team-a api-123 50m 200Mi"
+        fetcher = TopMetricsFetcher(mock_run_kubectl)
+        fetcher._THREAD_PARSE_MIN_CHARS = 1
+        offloaded: list[Any] = []
+
+        async def _fake_to_thread(func: Any, *args: Any) -> Any:
+            offloaded.append(func)
+            return func(*args)
+
+        monkeypatch.setattr(asyncio, "to_thread", _fake_to_thread)
+
+        rows = await fetcher.fetch_top_pods_all_namespaces()
+
+        assert [row["pod_name"] for row in rows] == ["api-123"]
+        assert offloaded == [fetcher._parse_top_pod_lines]
+
     @pytest.mark.asyncio
     async def test_fetch_top_pods_retries_timeout_then_succeeds(
         self,
@@ -115,7 +145,7 @@ class TestTopMetricsFetcher:
         assert mock_run_kubectl.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_fetch_top_nodes_for_names_chunks_requests(
+    async def test_fetch_top_nodes_for_names_issues_one_call_per_name(
         self,
         mock_run_kubectl: AsyncMock,
     ) -> None:
@@ -125,7 +155,6 @@ class TestTopMetricsFetcher:
             "node-c 300m 15% 3000Mi 60%",
         ]
         fetcher = TopMetricsFetcher(mock_run_kubectl)
-        fetcher._TARGET_TOP_NODE_CHUNK_SIZE = 2
 
         rows = await fetcher.fetch_top_nodes_for_names(
             ["node-a", "node-b", "node-c"],
@@ -142,6 +171,55 @@ class TestTopMetricsFetcher:
         assert second_args[:3] == ("top", "node", "node-b")
         assert third_args[:3] == ("top", "node", "node-c")
 
+    @pytest.mark.asyncio
+    async def test_fetch_top_nodes_for_names_uses_bulk_call_for_many_names(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        mock_run_kubectl.return_value = "\n".join(
+            [
+                "node-a 100m 5% 1000Mi 20%",
+                "node-b 200m 10% 2000Mi 40%",
+                "node-x 300m 15% 3000Mi 60%",
+            ]
+        )
+        fetcher = TopMetricsFetcher(mock_run_kubectl)
+        fetcher._BULK_TOP_NAME_THRESHOLD = 2
+
+        rows = await fetcher.fetch_top_nodes_for_names(["node-b", "node-a", "node-z"])
+
+        assert [row["node_name"] for row in rows] == ["node-b", "node-a"]
+        assert mock_run_kubectl.await_count == 1
+        assert mock_run_kubectl.await_args_list[0].args[0][:3] == (
+            "top",
+            "node",
+            "--no-headers",
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_top_pods_for_namespace_uses_bulk_call_for_many_names(
+        self,
+        mock_run_kubectl: AsyncMock,
+    ) -> None:
+        mock_run_kubectl.return_value = "\n".join(
+            ["api-1 10m 20Mi", "api-2 20m 40Mi", "other 5m 10Mi"]
+        )
+        fetcher = TopMetricsFetcher(mock_run_kubectl)
+        fetcher._BULK_TOP_NAME_THRESHOLD = 2
+
+        rows = await fetcher.fetch_top_pods_for_namespace("team-a", ["api-2", "api-1"])
+
+        assert [row["pod_name"] for row in rows] == ["api-2", "api-1"]
+        assert rows[0]["namespace"] == "team-a"
+        assert mock_run_kubectl.await_count == 1
+        assert mock_run_kubectl.await_args_list[0].args[0][:5] == (
+            "top",
+            "pod",
+            "-n",
+            "team-a",
+            "--no-headers",
+        )
+
     @pytest.mark.asyncio
     async def test_fetch_top_pods_for_namespace_parses_scoped_output(
         self,
@@ -171,7 +249,7 @@ class TestTopMetricsFetcher:
         assert "--request-timeout=8s" in args
 
     @pytest.mark.asyncio
-    async def test_fetch_top_pods_for_namespace_chunks_requests(
+    async def test_fetch_top_pods_for_namespace_issues_one_call_per_name(
         self,
         mock_run_kubectl: AsyncMock,
     ) -> None:
@@ -180,7 +258,6 @@ class TestTopMetricsFetcher:
             "api-2 20m 40Mi",
         ]
         fetcher = TopMetricsFetcher(mock_run_kubectl)
-        fetcher._TARGET_TOP_POD_CHUNK_SIZE = 1
 
         rows = await fetcher.fetch_top_pods_for_namespace(
             "team-a",
@@ -39,3 +39,42 @@ class TestTeamFetcher:
         """Test get_all_teams returns empty list when no teams loaded."""
         result = fetcher.get_all_teams()
         assert result == []
+
+    def test_load_codeowners_splits_tabs_and_dedupes_owners(
+        self, fetcher: TeamFetcher, tmp_path: Path
+    ) -> None:
+        """Test owner parsing handles tab separators and repeated owners."""
+        codeowners = tmp_path / "CODEOWNERS"
+        codeowners.write_text(
+            "/charts/api/\t@org/team-a  @org/sre @org/team-a\n"
+            "/charts/web/ @org/team-a  @org/sre @org/team-a\r\n"
+        )
+
+        fetcher.load_codeowners(codeowners)
+
+        assert [team.pattern for team in fetcher.teams] == [
+            "charts/api/",
+            "charts/web/",
+        ]
+        for team in fetcher.teams:
+            assert team.owners == ["@org/team-a", "@org/sre"]
+
+    def test_get_team_for_path_prefers_longest_prefix(
+        self, fetcher: TeamFetcher, tmp_path: Path
+    ) -> None:
+        """Test prefix lookup picks the longest pattern and survives reloads."""
+        codeowners = tmp_path / "CODEOWNERS"
+        codeowners.write_text(
+            "# TEAM: core\nsvc-* @org/core\n# TEAM: payments\nsvc-pay* @org/payments\n"
+        )
+        fetcher.load_codeowners(codeowners)
+
+        assert fetcher.get_team_for_path(Path("charts/svc-payments")) == "Payments"
+        assert fetcher.get_team_for_path(Path("charts/svc-api")) == "Core"
+        assert fetcher.get_team_for_path(Path("charts/other")) is None
+
+        codeowners.write_text("other/ @org/misc\n")
+        fetcher.load_codeowners(codeowners)
+
+        assert fetcher.get_team_for_path(Path("charts/other")) == "Misc"
+        assert fetcher.get_team_for_path(Path("charts/svc-api")) is None
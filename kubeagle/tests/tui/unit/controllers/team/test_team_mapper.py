@@ -183,3 +183,44 @@ class TestTeamMapper:
         )
 
         assert result == "Unknown"
+
+    def test_extract_owners_from_line_dedupes_in_order(self) -> None:
+        """Test owner extraction keeps first-seen order without duplicates."""
+        mapper = TeamMapper()
+
+        owners = mapper._extract_owners_from_line(
+            "@org/sre @org/payments @org/sre ops@example.com ops@example.com"
+        )
+
+        assert owners == ["@org/sre", "@org/payments", "@example", "ops@example.com"]
+
+    def test_load_codeowners_reuses_cached_parse_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test unchanged CODEOWNERS files are parsed once across mappers."""
+        codeowners = tmp_path / "CODEOWNERS"
+        codeowners.write_text("/charts/api/ @org/payments\n", encoding="utf-8")
+        parse_calls: list[Path] = []
+        original_parse = TeamMapper._parse_codeowners_file
+
+        def _counting_parse(self: TeamMapper, path: Path) -> bool:
+            parse_calls.append(path)
+            return original_parse(self, path)
+
+        monkeypatch.setattr(TeamMapper, "_parse_codeowners_file", _counting_parse)
+
+        first = TeamMapper()
+        first.load_codeowners(codeowners)
+        first.team_mapping["registered"] = "Other"
+        second = TeamMapper()
+        second.load_codeowners(codeowners)
+
+        assert len(parse_calls) == 1
+        assert second.team_mapping == {"charts/api": "Payments"}
+
+        codeowners.write_text("/charts/web/ @org/frontend\n", encoding="utf-8")
+        third = TeamMapper()
+        third.load_codeowners(codeowners)
+
+        assert len(parse_calls) == 2
+        assert third.team_mapping == {"charts/web": "Frontend"}
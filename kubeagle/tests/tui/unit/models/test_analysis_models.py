@@ -115,7 +115,6 @@ class TestExtremeLimitRatio:
             memory_request=128,
             memory_limit=512,
             memory_ratio=4.0,
-            max_ratio=5.0,
         )
 
         assert ratio.chart_name == "my-chart"
@@ -135,7 +134,6 @@ class TestExtremeLimitRatio:
                 memory_request=128,
                 memory_limit=256,
                 memory_ratio=2.0,
-                max_ratio=3.0,
             ),
             ExtremeLimitRatio(
                 chart_name="chart2",
@@ -146,13 +144,27 @@ class TestExtremeLimitRatio:
                 memory_request=128,
                 memory_limit=512,
                 memory_ratio=4.0,
-                max_ratio=5.0,
             ),
         ]
 
         sorted_ratios = sorted(ratios, key=lambda x: x.max_ratio, reverse=True)
         assert sorted_ratios[0].chart_name == "chart2"
 
+    def test_extreme_limit_ratio_derives_max_ratio(self) -> None:
+        """max_ratio should follow the larger of the CPU and memory ratios."""
+        ratio = ExtremeLimitRatio(
+            chart_name="my-chart",
+            team="my-team",
+            cpu_request=100,
+            cpu_limit=200,
+            cpu_ratio=2.0,
+            memory_request=128,
+            memory_limit=768,
+            memory_ratio=6.0,
+        )
+
+        assert ratio.max_ratio == 6.0
+
     def test_extreme_limit_ratio_serialization(self) -> None:
         """Test ExtremeLimitRatio serialization."""
         ratio = ExtremeLimitRatio(
@@ -164,7 +176,6 @@ class TestExtremeLimitRatio:
             memory_request=128,
             memory_limit=512,
             memory_ratio=4.0,
-            max_ratio=5.0,
         )
 
         data = ratio.model_dump()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pytest
+
+from kubeagle.models.cache import data_cache
 from kubeagle.models.cache.data_cache import DataCache
 
 
@@ -13,3 +16,44 @@ class TestDataCache:
         cache = DataCache()
 
         assert cache is not None
+
+    @pytest.mark.asyncio
+    async def test_get_respects_entry_and_key_ttl(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test get uses the entry TTL, falling back to the per-key default."""
+        now = [1000.0]
+        monkeypatch.setattr(data_cache.time, "monotonic", lambda: now[0])
+        cache = DataCache()
+        await cache.set("events", "default-ttl")
+        await cache.set("custom", "entry-ttl", ttl=10)
+
+        now[0] += 11
+        assert await cache.get("events") == "default-ttl"
+        assert await cache.get("custom") is None
+        assert await cache.get_if_fresh("events", max_age_seconds=20) == "default-ttl"
+        assert await cache.get_if_fresh("events", max_age_seconds=5) is None
+
+        now[0] += DataCache.TTL_SECONDS["events"]
+        assert await cache.get("events") is None
+
+    @pytest.mark.asyncio
+    async def test_set_evicts_expired_then_oldest(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test bounded cache drops expired entries before the oldest live one."""
+        now = [1000.0]
+        monkeypatch.setattr(data_cache.time, "monotonic", lambda: now[0])
+        cache = DataCache(max_entries=2)
+        await cache.set("short", 1, ttl=5)
+        now[0] += 1
+        await cache.set("old", 2, ttl=100)
+        now[0] += 10
+        await cache.set("new", 3, ttl=100)
+
+        assert set(cache._cache) == {"old", "new"}
+
+        now[0] += 1
+        await cache.set("newest", 4, ttl=100)
+
+        assert set(cache._cache) == {"new", "newest"}
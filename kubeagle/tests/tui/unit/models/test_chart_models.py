@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
 import pytest
 from pydantic import ValidationError
 
 from kubeagle.constants.enums import QoSClass
+from kubeagle.models.charts.active_charts import (
+    get_active_charts_set,
+    load_active_charts_from_file,
+)
 from kubeagle.models.charts.chart_info import ChartInfo, HelmReleaseInfo
 
 
@@ -173,3 +180,33 @@ class TestHelmReleaseInfo:
         data = release.model_dump()
         assert data["name"] == "backend"
         assert data["status"] == "pending-install"
+
+
+class TestActiveCharts:
+    """Tests for active charts file loading."""
+
+    def test_load_active_charts_skips_comments_and_blank_lines(
+        self, tmp_path: Path
+    ) -> None:
+        """Test loader returns stripped, non-comment chart names."""
+        path = tmp_path / "active.txt"
+        path.write_text("# header\n api \n\nweb\r\n#disabled\n", encoding="utf-8")
+
+        assert load_active_charts_from_file(path) == frozenset({"api", "web"})
+        assert get_active_charts_set(tmp_path / "missing.txt") == frozenset()
+
+    def test_load_active_charts_rereads_file_after_change(
+        self, tmp_path: Path
+    ) -> None:
+        """Test cached charts are refreshed when the file changes on disk."""
+        path = tmp_path / "active.txt"
+        path.write_text("api\n", encoding="utf-8")
+        first = load_active_charts_from_file(path)
+
+        assert load_active_charts_from_file(path) is first
+
+        path.write_text("api\nweb\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_active_charts_from_file(path) == frozenset({"api", "web"})
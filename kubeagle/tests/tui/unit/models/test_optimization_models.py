@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import pytest
+
+import kubeagle.models as models_pkg
+import kubeagle.models.optimization as optimization_pkg
+from kubeagle.models.optimization import optimizer_controller
 from kubeagle.models.optimization.optimization_rule import (
     OptimizationRule,
 )
@@ -47,3 +52,28 @@ class TestOptimizationViolation:
         assert violation.rule_id == "RES006"
         assert violation.category == "resources"
         assert violation.auto_fixable is True
+
+
+class TestLazyModelExports:
+    """Tests for lazily resolved package exports."""
+
+    def test_all_models_exports_resolve(self) -> None:
+        """Every name in kubeagle.models.__all__ should resolve on access."""
+        for name in models_pkg.__all__:
+            assert getattr(models_pkg, name) is not None
+        assert models_pkg.ChartInfo.__name__ == "ChartInfo"
+
+    def test_optimization_controller_exports_resolve_to_module_objects(self) -> None:
+        """Controller exports should be the optimizer_controller objects."""
+        assert (
+            optimization_pkg.UnifiedOptimizerController
+            is optimizer_controller.UnifiedOptimizerController
+        )
+        assert models_pkg.OptimizerController is optimizer_controller.OptimizerController
+
+    def test_unknown_export_raises_attribute_error(self) -> None:
+        """Unknown names should raise AttributeError like a regular module."""
+        with pytest.raises(AttributeError):
+            _ = models_pkg.NotAModel
+        with pytest.raises(AttributeError):
+            _ = optimization_pkg.NotAModel
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 
@@ -14,6 +15,7 @@ from kubeagle.models.optimization.optimizer_controller import (
     UnifiedOptimizerController,
 )
 from kubeagle.optimizer.helm_renderer import HelmRenderResult
+from kubeagle.optimizer.rules import RULES
 
 
 def _make_chart() -> ChartInfo:
@@ -68,6 +70,21 @@ class TestUnifiedOptimizerControllerResourceFormatting:
         assert chart_dict["resources"]["limits"]["memory"] == "256Mi"
         assert chart_dict["qos_class"] == "Burstable"
 
+    def test_chart_dict_containers_only_built_for_probed_charts(self) -> None:
+        """Container entries should exist only when a probe is configured."""
+        controller = UnifiedOptimizerController()
+        probed = controller._chart_info_to_dict(_make_chart())
+        unprobed = controller._chart_info_to_dict(
+            _make_chart().model_copy(
+                update={"has_liveness": False, "has_readiness": False}
+            )
+        )
+
+        assert probed["containers"] == [
+            {"name": "payments-api", "livenessProbe": {}, "readinessProbe": {}}
+        ]
+        assert unprobed["containers"] == []
+
     def test_current_value_for_memory_ratio_uses_mi(self) -> None:
         """RES006 current value should display memory in Mi, not raw bytes."""
         controller = UnifiedOptimizerController()
@@ -230,6 +247,134 @@ class TestUnifiedOptimizerControllerResourceFormatting:
         assert violations
         assert all(violation.analysis_source == "values" for violation in violations)
 
+    def test_default_rules_share_registered_rule_objects(self) -> None:
+        """Default rules should be a tuple of the registered rules, not copies."""
+        controller = UnifiedOptimizerController()
+
+        assert isinstance(controller.rules, tuple)
+        assert len(controller.rules) == len(RULES)
+        assert all(
+            rule is registered
+            for rule, registered in zip(controller.rules, RULES, strict=True)
+        )
+        assert UnifiedOptimizerController().rules is controller.rules
+
+    def test_rendered_rule_inputs_are_cached_until_chart_changes(
+        self,
+        monkeypatch,
+        tmp_path: Path,
+    ) -> None:
+        """Rendered checks should reuse rule inputs until a chart file changes."""
+        chart_dir = tmp_path / "payments"
+        templates_dir = chart_dir / "templates"
+        templates_dir.mkdir(parents=True)
+        values_path = chart_dir / "values.yaml"
+        values_path.write_text("replicaCount: 1\n", encoding="utf-8")
+        (chart_dir / "Chart.yaml").write_text(
+            "apiVersion: v2\nname: payments\nversion: 0.1.0\n",
+            encoding="utf-8",
+        )
+        template_path = templates_dir / "deployment.yaml"
+        template_path.write_text("kind: Deployment\n", encoding="utf-8")
+
+        chart = _make_chart().model_copy(update={"values_file": str(values_path)})
+        controller = UnifiedOptimizerController(analysis_source="rendered")
+        controller._helm_available = True
+        render_calls: list[Path] = []
+
+        def _fake_render_chart(**kwargs) -> HelmRenderResult:
+            render_calls.append(kwargs["values_file"])
+            return HelmRenderResult(
+                ok=True,
+                chart_dir=kwargs["chart_dir"],
+                values_file=kwargs["values_file"],
+            )
+
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.render_chart",
+            _fake_render_chart,
+        )
+
+        assert controller.check_chart(chart) == []
+        assert controller.check_chart(chart) == []
+        assert len(render_calls) == 1
+
+        stat = template_path.stat()
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        controller.check_chart(chart)
+        assert len(render_calls) == 2
+
+        controller.invalidate_rendered_cache()
+        controller.check_chart(chart)
+        assert len(render_calls) == 3
+
+    def test_rendered_cache_is_per_chart_and_returns_copies(
+        self,
+        monkeypatch,
+        tmp_path: Path,
+    ) -> None:
+        """Sub-charts sharing a values file get their own, unshared rule inputs."""
+        chart_dir = tmp_path / "umbrella"
+        chart_dir.mkdir()
+        values_path = chart_dir / "values.yaml"
+        values_path.write_text("api: {}\n", encoding="utf-8")
+        shared_dir = tmp_path / "shared-lib"
+        shared_dir.mkdir()
+        shared_template = shared_dir / "helpers.tpl"
+        shared_template.write_text("{{/* helpers */}}\n", encoding="utf-8")
+        (chart_dir / "Chart.yaml").write_text(
+            "apiVersion: v2\nname: umbrella\nversion: 0.1.0\n"
+            "dependencies:\n"
+            "  - name: shared-lib\n"
+            "    repository: file://../shared-lib\n",
+            encoding="utf-8",
+        )
+
+        controller = UnifiedOptimizerController(analysis_source="rendered")
+        render_calls: list[str] = []
+
+        def _fake_render_chart(**kwargs) -> HelmRenderResult:
+            render_calls.append(kwargs["release_name"])
+            return HelmRenderResult(
+                ok=True,
+                chart_dir=kwargs["chart_dir"],
+                values_file=kwargs["values_file"],
+            )
+
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.render_chart",
+            _fake_render_chart,
+        )
+        monkeypatch.setattr(
+            "kubeagle.models.optimization.optimizer_controller.build_rule_inputs_from_rendered",
+            lambda _docs, *, chart_name: [{"chart_name": chart_name, "resources": {}}],
+        )
+        parent = _make_chart().model_copy(
+            update={"name": "umbrella", "values_file": str(values_path)}
+        )
+        sub_chart = parent.model_copy(update={"name": "api"})
+
+        parent_inputs = controller._rendered_rule_inputs(parent, chart_dir, values_path)
+        sub_inputs = controller._rendered_rule_inputs(sub_chart, chart_dir, values_path)
+
+        assert parent_inputs is not None and sub_inputs is not None
+        assert parent_inputs[0]["chart_name"] == "umbrella"
+        assert sub_inputs[0]["chart_name"] == "api"
+        assert render_calls == ["umbrella", "api"]
+
+        sub_inputs[0]["resources"]["limits"] = {"cpu": "1"}
+        cached_inputs = controller._rendered_rule_inputs(sub_chart, chart_dir, values_path)
+        assert cached_inputs == [{"chart_name": "api", "resources": {}}]
+        assert render_calls == ["umbrella", "api"]
+
+        stat = shared_template.stat()
+        os.utime(
+            shared_template,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        controller._rendered_rule_inputs(sub_chart, chart_dir, values_path)
+        assert render_calls == ["umbrella", "api", "api"]
+
     def test_resolve_worker_count_respects_configured_max(self) -> None:
         """Configured max_workers should bound parallel workers."""
         controller = UnifiedOptimizerController(max_workers=3)
@@ -816,6 +816,20 @@ class TestGenerateJsonReport:
         assert "description" in v
         assert "fix_available" in v
 
+    def test_json_writes_non_ascii_as_utf8(self) -> None:
+        data = _make_report_data(cluster_name="küme-東京")
+        result = TUIReportGenerator(data=data).generate_json_report("summary")
+        assert '"cluster": "küme-東京"' in result
+        assert "\\u" not in result
+
+    def test_json_writes_nan_as_null(self) -> None:
+        chart = _make_chart("frontend", "team-fe", QoSClass.BURSTABLE, True, 3,
+                            cpu_request=float("nan"))
+        data = _make_report_data(charts=[chart])
+        result = TUIReportGenerator(data=data).generate_json_report("brief")
+        assert "NaN" not in result
+        assert json.loads(result)["charts"]["charts"][0]["cpu_request"] is None
+
 
 # =============================================================================
 # GET DICT HELPERS
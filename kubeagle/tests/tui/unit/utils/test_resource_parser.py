@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from kubeagle.utils.resource_parser import (
     memory_str_to_bytes,
+    memory_str_to_bytes_cached,
     parse_cpu,
     parse_cpu_from_dict,
+    parse_cpu_millicores_cached,
     parse_memory_from_dict,
 )
 
@@ -67,6 +69,20 @@ class TestMemoryStrToBytes:
         assert memory_str_to_bytes("") == 0.0
 
 
+class TestCachedQuantityParsers:
+    """Tests for the memoized quantity parsers."""
+
+    def test_parse_cpu_millicores_cached_matches_parse_cpu(self) -> None:
+        """Cached CPU parser should return parse_cpu scaled to millicores."""
+        for value in ("100m", "1.5", "500000u", "", "invalid"):
+            assert parse_cpu_millicores_cached(value) == parse_cpu(value) * 1000
+
+    def test_memory_str_to_bytes_cached_matches_uncached(self) -> None:
+        """Cached memory parser should match memory_str_to_bytes."""
+        for value in ("512Mi", "1Gi", "1024Ki", "", "invalid"):
+            assert memory_str_to_bytes_cached(value) == memory_str_to_bytes(value)
+
+
 class TestParseCpuFromDict:
     """Tests for parse_cpu_from_dict function."""
 
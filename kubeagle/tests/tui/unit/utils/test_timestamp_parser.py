@@ -0,0 +1,36 @@
+"""Tests for timestamp parser utilities."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from kubeagle.utils.timestamp_parser import parse_iso_timestamp
+
+
+class TestParseIsoTimestamp:
+    """Tests for parse_iso_timestamp function."""
+
+    def test_parse_zulu_suffix(self) -> None:
+        """Test parsing timestamps with a Z suffix."""
+        assert parse_iso_timestamp("2024-01-02T03:04:05Z") == datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+        )
+
+    def test_parse_offset_suffix(self) -> None:
+        """Test parsing timestamps with an explicit offset."""
+        parsed = parse_iso_timestamp("2024-01-02T03:04:05+00:00")
+        assert parsed is not None
+        assert parsed.tzinfo is not None
+
+    def test_parse_invalid_values(self) -> None:
+        """Test invalid, empty, and non-string values return None."""
+        assert parse_iso_timestamp("not-a-timestamp") is None
+        assert parse_iso_timestamp("") is None
+        assert parse_iso_timestamp(None) is None
+        assert parse_iso_timestamp(["2024-01-02T03:04:05Z"]) is None
+
+    def test_repeated_values_share_parsed_result(self) -> None:
+        """Test repeated timestamp strings reuse the memoized datetime."""
+        first = parse_iso_timestamp("2024-05-06T07:08:09Z")
+        second = parse_iso_timestamp("".join(["2024-05-06T07:08:09", "Z"]))
+        assert first is second
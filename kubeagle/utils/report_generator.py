@@ -9,6 +9,8 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from kubeagle.constants.enums import QoSClass, Severity
 from kubeagle.models.analysis.violation import ViolationResult
 from kubeagle.models.charts.chart_info import ChartInfo
@@ -126,8 +128,6 @@ class TUIReportGenerator:
 
     def generate_json_report(self, report_format: str = "full") -> str:
         """Generate a JSON report with equivalent data."""
-        import json
-
         report_data: dict[str, Any] = {
             "metadata": {
                 "generated": self.data.timestamp,
@@ -150,7 +150,17 @@ class TUIReportGenerator:
             report_data["violations"] = self._get_violations_dict()
             report_data["recommendations"] = self._get_recommendations_list()
 
-        return json.dumps(report_data, indent=2, default=str)
+        # Datetimes go through default=str, as they did with json.dumps. Unlike
+        # json.dumps, non-ASCII text is written as UTF-8 rather than \uXXXX
+        # escapes, NaN/Infinity become null, and exponents drop the leading
+        # "+"/zero padding (1e16, 1.5e-7). Each is still valid JSON.
+        return orjson.dumps(
+            report_data,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
 
     def _add(self, line: str = "") -> None:
         """Add a line to the report."""
@@ -5,6 +5,7 @@ Provides functions to parse Kubernetes resource strings into standardized format
 - Memory: parsed to Mi (mebibytes) or bytes
 """
 
+from functools import lru_cache
 from typing import Any
 
 # Module-level constants to avoid re-creating on every function call.
@@ -101,6 +102,23 @@ def memory_str_to_bytes(memory_str: str) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=4096)
+def parse_cpu_millicores_cached(cpu_str: str) -> float:
+    """Parse a CPU quantity string to millicores, memoized per unique value.
+
+    Cluster-wide pod specs and ``kubectl top`` output repeat a small set of
+    quantity strings, so hot loops use this instead of ``parse_cpu``.
+    Arguments must be hashable.
+    """
+    return parse_cpu(cpu_str) * 1000
+
+
+@lru_cache(maxsize=4096)
+def memory_str_to_bytes_cached(memory_str: str) -> float:
+    """Memoized ``memory_str_to_bytes`` for repeated quantity strings."""
+    return memory_str_to_bytes(memory_str)
+
+
 def _resolve_resources_dict(values: dict[str, Any]) -> dict[str, Any]:
     """Resolve the resources dict, falling back to resources.default.
 
@@ -0,0 +1,69 @@
+"""Kubernetes timestamp parsing utilities.
+
+Event payloads repeat the same ``lastTimestamp``/``firstTimestamp`` strings
+across correlated events, so parsed values are memoized per unique string.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import suppress
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing "Z" natively from 3.11 on.
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(timestamp: str) -> datetime:
+        if timestamp.endswith("Z"):
+            timestamp = f"{timestamp[:-1]}+00:00"
+        return datetime.fromisoformat(timestamp)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp_str(timestamp: str) -> datetime | None:
+    """Parse a non-empty ISO-8601 string, memoized per unique value."""
+    with suppress(ValueError):
+        return _fromisoformat(timestamp)
+    return None
+
+
+def parse_iso_timestamp(timestamp: Any) -> datetime | None:
+    """Parse kubernetes timestamp strings into aware datetimes.
+
+    Args:
+        timestamp: Raw timestamp value (e.g., "2024-01-01T00:00:00Z").
+
+    Returns:
+        Parsed datetime, or None for empty, non-string, or invalid values.
+    """
+    if not isinstance(timestamp, str) or not timestamp:
+        return None
+    return _parse_iso_timestamp_str(timestamp)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_epoch_str(timestamp: str) -> float | None:
+    """Parse a non-empty ISO-8601 string into epoch seconds, memoized."""
+    parsed = _parse_iso_timestamp_str(timestamp)
+    return parsed.timestamp() if parsed is not None else None
+
+
+def parse_iso_epoch(timestamp: Any) -> float | None:
+    """Parse kubernetes timestamp strings into POSIX epoch seconds.
+
+    Float epochs let hot loops compare against a precomputed cutoff without
+    datetime/timedelta arithmetic per item.
+
+    Args:
+        timestamp: Raw timestamp value (e.g., "2024-01-01T00:00:00Z").
+
+    Returns:
+        Epoch seconds, or None for empty, non-string, or invalid values.
+    """
+    if not isinstance(timestamp, str) or not timestamp:
+        return None
+    return _parse_iso_epoch_str(timestamp)